@@ -12,44 +12,139 @@ load_dotenv()
 # IMPORTS
 # =====================================================
 
-from fastapi import FastAPI, UploadFile, File, Query, HTTPException, Form
-from fastapi.responses import FileResponse
+from fastapi import (
+    FastAPI, UploadFile, File, Query, HTTPException, Form, BackgroundTasks
+)
+from fastapi.responses import (
+    StreamingResponse, JSONResponse, PlainTextResponse
+)
 from pydantic import BaseModel, Field
 
-import pdfplumber
 import io
 import re
+import json
+import asyncio
+import hashlib
 import logging
-
-from app.services.ai_optimizer import optimize_resume_ai
-from app.services.jobs import fetch_jobs
+from typing import List, Optional
+from contextlib import asynccontextmanager
+
+from app.services.ai_optimizer import (
+    optimize_resume_ai,
+    stream_optimize_resume_ai,
+    fallback_response,
+    get_openai_client
+)
+from app.services.jobs import (
+    fetch_jobs,
+    build_filters,
+    get_session,
+    compute_match_score,
+    is_entry_level,
+    ADZUNA_BASE_URL
+)
+from app.services.resume_parser import parse_resume
+from app.services import llm_ledger
+from app.services import artifacts
+from app.services import metrics
+from app.services import cache
+from app.services.profiling import ProfilingMiddleware
+from app.services.load_shedding import (
+    LoadSheddingMiddleware,
+    LIMITS,
+    BATCH_CONCURRENCY,
+    slot
+)
+from app.services.http_encoding import FastJSONResponse, CompressionMiddleware
+from app.services.skills import TECH_KEYWORDS, fast_keyword_match
 from app.services.domain_classifier import generate_job_query
-from app.services.resume_builder import build_resume_pdf
+from app.services.resume_builder import build_resume_pdf, LAYOUT_VERSION
+from app.services import pdf_cache
+from app.services import tasks as task_queue
+from app.services import render_pool
+from app.services import warmup
+from app.services.zip_stream import ZipStream
+from app.services.pdf_output import iter_and_close, buffer_size
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 
 
 # =====================================================
 # APP CONFIG
 # =====================================================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+
+    if not warmup.WARMUP_ENABLED:
+        warmup.mark_ready()
+
+    else:
+
+        pending = asyncio.get_running_loop().run_in_executor(
+            None,
+            warmup.run,
+            WARMUP_STEPS
+        )
+
+        if warmup.WARMUP_BLOCKING:
+            await pending
+
+    yield
+
+
 app = FastAPI(
     title="GradHire API",
     description="AI-powered resume optimization and job matching backend",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
+app.add_middleware(CompressionMiddleware)
+
+app.add_middleware(LoadSheddingMiddleware)
+
+# Outside the load shedder, so shed requests are counted too (by path, as
+# they never reach the router)
+app.add_middleware(metrics.MetricsMiddleware)
+app.add_middleware(ProfilingMiddleware)
+
 # CORS CONFIG
+# Added last so it is outermost: responses produced by the middlewares
+# above (503s from load shedding) also carry CORS headers
 app.add_middleware(
     CORSMiddleware,
     allow_origin_regex=r"https://.*\.lovable\.app",
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After"],
 )
 
 MAX_FILE_SIZE = 5 * 1024 * 1024
 ALLOWED_COUNTRIES = {"in", "us"}
 
+# Selectable with /jobs/from-resume?fields=... (list views skip descriptions)
+JOB_FIELDS = (
+    "id", "title", "company", "location", "description", "matchScore", "applyURL"
+)
+
+BATCH_MAX_JOBS = 20
+
+BATCH_RENDER_MAX = 50
+
+TEXT_CACHE_TTL = int(os.getenv("TEXT_CACHE_TTL", str(24 * 60 * 60)))
+
+# Extracted resume text keyed by the uploaded file's hash
+text_cache = cache.TieredCache(
+    "pdf_text",
+    ttl=TEXT_CACHE_TTL,
+    local_max_bytes=4 * 1024 * 1024,
+    shared_max_bytes=32 * 1024 * 1024,
+    codec="text"
+)
+
 logging.basicConfig(level=logging.WARNING)
 
 
@@ -62,6 +157,15 @@ class OptimizeRequest(BaseModel):
     job_description: str = Field(..., min_length=20)
 
 
+class BatchOptimizeRequest(BaseModel):
+    resume_text: str = Field(..., min_length=50)
+    job_descriptions: List[str] = Field(..., min_length=1, max_length=BATCH_MAX_JOBS)
+
+
+class BatchRenderRequest(BaseModel):
+    resumes: List[dict] = Field(..., min_length=1, max_length=BATCH_RENDER_MAX)
+
+
 # =====================================================
 # TEXT NORMALIZATION
 # =====================================================
@@ -78,39 +182,6 @@ def normalize_text(text: str) -> str:
 # INDUSTRY-GRADE RESUME VALIDATION (GradHire)
 # =====================================================
 
-TECH_KEYWORDS = {
-
-    # languages
-    "python", "java", "javascript", "typescript", "c++", "c#", "go", "swift",
-    "kotlin", "rust", "matlab", "r",
-
-    # web
-    "react", "angular", "vue", "node", "express", "html", "css",
-    "frontend", "backend", "fullstack",
-
-    # database
-    "sql", "mysql", "postgresql", "mongodb", "firebase", "redis",
-
-    # cloud / devops
-    "aws", "azure", "gcp", "docker", "kubernetes", "jenkins",
-    "ci/cd", "devops",
-
-    # mobile
-    "ios", "android", "flutter", "react native",
-
-    # AI/ML
-    "machine learning", "deep learning", "pytorch", "tensorflow",
-    "scikit", "neural network", "nlp", "computer vision",
-    "huggingface",
-
-    # tools / backend
-    "git", "github", "api", "rest", "fastapi", "flask", "django",
-
-    # data
-    "pandas", "numpy", "data analysis", "data science"
-}
-
-
 RESUME_SECTION_KEYWORDS = {
 
     "education",
@@ -139,6 +210,7 @@ NON_RESUME_KEYWORDS = {
 MIN_WORD_COUNT = 120
 
 
+@metrics.stage("is_valid_resume")
 def is_valid_resume(text: str) -> bool:
 
     if not text:
@@ -208,6 +280,46 @@ def is_valid_resume(text: str) -> bool:
 # PDF EXTRACTION
 # =====================================================
 
+def extract_pdf_text(content: bytes) -> str:
+
+    # Imported on first use to keep cold start fast
+    import pdfplumber
+
+    text = ""
+
+    with metrics.stage("pdf_extraction"), \
+            pdfplumber.open(io.BytesIO(content)) as pdf:
+
+        if len(pdf.pages) == 0:
+            raise HTTPException(400, "Invalid PDF")
+
+        for page in pdf.pages:
+
+            extracted = page.extract_text()
+
+            if extracted:
+                text += extracted + "\n"
+
+    return text
+
+
+def read_pdf_text(content: bytes) -> str:
+
+    # Re-uploads of the same file skip pdfplumber in every worker
+    key = hashlib.sha256(content).hexdigest()
+
+    cached = text_cache.get(key)
+
+    if cached is not None:
+        return cached
+
+    text = extract_pdf_text(content)
+
+    text_cache.put(key, text)
+
+    return text
+
+
 async def extract_resume_text(file: UploadFile) -> str:
 
     if not file.filename:
@@ -226,19 +338,8 @@ async def extract_resume_text(file: UploadFile) -> str:
 
     try:
 
-        text = ""
-
-        with pdfplumber.open(io.BytesIO(content)) as pdf:
-
-            if len(pdf.pages) == 0:
-                raise HTTPException(400, "Invalid PDF")
-
-            for page in pdf.pages:
-
-                extracted = page.extract_text()
-
-                if extracted:
-                    text += extracted + "\n"
+        # pdfplumber and the shared cache (SQLite) stay off the event loop
+        text = await run_in_threadpool(read_pdf_text, content)
 
     except HTTPException:
         raise
@@ -293,38 +394,87 @@ async def upload_resume(file: UploadFile = File(...)):
 # JOB SEARCH
 # =====================================================
 
+def parse_fields(fields: Optional[str]):
+
+    if not fields:
+        return None
+
+    selected = [name.strip() for name in fields.split(",") if name.strip()]
+
+    unknown = [name for name in selected if name not in JOB_FIELDS]
+
+    if unknown:
+        raise HTTPException(
+            400,
+            f"Unknown fields: {', '.join(unknown)} "
+            f"(choose from {', '.join(JOB_FIELDS)})"
+        )
+
+    return selected
+
+
+def project(jobs: list, selected):
+
+    if not selected:
+        return jobs
+
+    return [{name: job.get(name) for name in selected} for job in jobs]
+
+
 @app.post("/jobs/from-resume")
 async def jobs_from_resume(
     file: UploadFile = File(...),
-    country: str = Query("in")
+    country: str = Query("in"),
+    fields: Optional[str] = Query(None),
+    where: Optional[str] = Query(None, max_length=100),
+    distance: Optional[int] = Query(None, ge=1, le=500),
+    salary_min: Optional[int] = Query(None, ge=0),
+    contract_type: Optional[str] = Query(None, pattern="^(permanent|contract)$"),
+    contract_time: Optional[str] = Query(None, pattern="^(full_time|part_time)$")
 ):
 
     if country not in ALLOWED_COUNTRIES:
         raise HTTPException(400, "Unsupported country")
 
+    selected = parse_fields(fields)
+
+    # Location / salary / contract filtering is done by Adzuna
+    filters = build_filters(
+        where=where,
+        distance=distance,
+        salary_min=salary_min,
+        contract_type=contract_type,
+        contract_time=contract_time
+    )
+
     text = await extract_resume_text(file)
 
     try:
 
         query = generate_job_query(text)
 
-        jobs = fetch_jobs(
+        # Adzuna calls and the shared page cache block: run them off the loop
+        jobs = await run_in_threadpool(
+            fetch_jobs,
             query=query,
             country=country,
-            resume_text=text
+            resume_text=text,
+            filters=filters
         )
 
         if not jobs:
 
             logging.warning("Fallback job query used")
 
-            jobs = fetch_jobs(
+            jobs = await run_in_threadpool(
+                fetch_jobs,
                 query="junior software engineer",
                 country=country,
-                resume_text=text
+                resume_text=text,
+                filters=filters
             )
 
-        return jobs or []
+        return project(jobs or [], selected)
 
     except Exception as e:
 
@@ -337,30 +487,149 @@ async def jobs_from_resume(
 # RESUME OPTIMIZATION
 # =====================================================
 
-@app.post("/resume/optimize")
-async def optimize_resume(request: OptimizeRequest):
+def summarize_optimization(result: dict) -> dict:
+
+    improved_bullets = []
+
+    for job in result.get("experience", []):
+
+        improved_bullets.extend(job.get("bullets", []))
+
+    return {
+
+        "missing_skills": result.get("missing_skills", [])[:10],
+
+        "improved_bullets": improved_bullets[:5],
+
+        "ats_keywords": result.get("ats_keywords", [])[:10]
+    }
+
+
+def sse_event(event: str, data) -> str:
+
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+PENDING_ARTIFACT = {"pending": True}
+FAILED_ARTIFACT = {"failed": True}
+
+
+def enhance_and_save(
+    resume_text: str,
+    job_description: str,
+    optimization_id: str,
+    use_llm: bool
+):
+
+    result = None
+
+    if use_llm:
+
+        try:
+            result = optimize_resume_ai(
+                resume_text,
+                job_description,
+                "/resume/optimize?mode=fast"
+            )
+        except Exception as e:
+            logging.error(f"Background optimize failed: {e}")
+
+    else:
+        logging.warning(f"LLM slots busy, keeping the local result for {optimization_id}")
+
+    # Never leave the pending marker behind: fall back to the local
+    # result, or mark the optimization as failed
+    if result is None:
+
+        try:
+            result = fallback_response(resume_text, job_description=job_description)
+        except Exception as e:
+            logging.error(f"Background fallback failed: {e}")
+            result = FAILED_ARTIFACT
+
+    try:
+        artifacts.save(result, optimization_id)
+    except Exception as e:
+        logging.error(f"Saving optimization {optimization_id} failed: {e}")
+
+
+async def enhance_in_background(resume_text: str, job_description: str, optimization_id: str):
+
+    # Enhancements take a slot of the llm class like LLM requests do, so
+    # they are bounded by LLM_CONCURRENCY. When the class is full they
+    # are skipped rather than queued
+    limit = LIMITS["llm"]
+
+    use_llm = limit.try_acquire()
 
     try:
+        await run_in_threadpool(
+            enhance_and_save,
+            resume_text,
+            job_description,
+            optimization_id,
+            use_llm
+        )
+    finally:
+        if use_llm:
+            limit.release()
+
+
+@app.post("/resume/optimize")
+async def optimize_resume(
+    request: OptimizeRequest,
+    background_tasks: BackgroundTasks,
+    mode: str = Query("llm", pattern="^(llm|fast)$")
+):
 
-        result = optimize_resume_ai(
+    # Instant local keyword match; LLM result follows as an enhancement
+    if mode == "fast":
+
+        keywords = fast_keyword_match(
             request.resume_text,
             request.job_description
         )
 
-        improved_bullets = []
+        optimization_id = artifacts.new_id()
 
-        for job in result.get("experience", []):
+        await run_in_threadpool(
+            artifacts.save,
+            PENDING_ARTIFACT,
+            optimization_id
+        )
 
-            improved_bullets.extend(job.get("bullets", []))
+        background_tasks.add_task(
+            enhance_in_background,
+            request.resume_text,
+            request.job_description,
+            optimization_id
+        )
 
         return {
+            "mode": "fast",
+            "missing_skills": keywords["missing_skills"][:10],
+            "improved_bullets": [],
+            "ats_keywords": keywords["ats_keywords"][:10],
+            "optimization_id": optimization_id
+        }
+
+    try:
+
+        result = await run_in_threadpool(
+            optimize_resume_ai,
+            request.resume_text,
+            request.job_description,
+            "/resume/optimize"
+        )
 
-            "missing_skills": result.get("missing_skills", [])[:10],
+        response = summarize_optimization(result)
 
-            "improved_bullets": improved_bullets[:5],
+        response["optimization_id"] = await run_in_threadpool(
+            artifacts.save,
+            result
+        )
 
-            "ats_keywords": result.get("skills", [])[:10]
-        }
+        return response
 
     except Exception as e:
 
@@ -372,17 +641,377 @@ async def optimize_resume(request: OptimizeRequest):
         )
 
 
+@app.get("/resume/optimize/{optimization_id}")
+async def get_optimization(optimization_id: str):
+
+    result = await run_in_threadpool(artifacts.load, optimization_id)
+
+    if result is None:
+        raise HTTPException(404, "Unknown or expired optimization_id")
+
+    if result.get("pending"):
+        return JSONResponse(status_code=202, content={"status": "pending"})
+
+    if result.get("failed"):
+        raise HTTPException(422, "Resume optimization failed")
+
+    response = summarize_optimization(result)
+    response["optimization_id"] = optimization_id
+
+    return response
+
+
+# =====================================================
+# RESUME OPTIMIZATION (SSE STREAM)
+# =====================================================
+
+@app.post("/resume/optimize/stream")
+async def optimize_resume_stream(request: OptimizeRequest):
+
+    def events():
+
+        try:
+
+            for event, data in stream_optimize_resume_ai(
+                request.resume_text,
+                request.job_description,
+                "/resume/optimize/stream"
+            ):
+
+                if event == "result":
+
+                    optimization_id = artifacts.save(data)
+
+                    data = summarize_optimization(data)
+                    data["optimization_id"] = optimization_id
+
+                yield sse_event(event, data)
+
+        except Exception as e:
+
+            logging.error(f"Optimize stream failed: {e}")
+
+            yield sse_event("error", {"detail": "Resume optimization failed"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
+# =====================================================
+# BATCH OPTIMIZATION (ONE RESUME, MANY JOBS)
+# =====================================================
+
+@app.post("/resume/optimize/batch")
+async def optimize_resume_batch(request: BatchOptimizeRequest):
+
+    # Identical job descriptions are optimized once
+    indices = {}
+
+    for i, jd in enumerate(request.job_descriptions):
+        indices.setdefault(jd.strip(), []).append(i)
+
+    semaphore = asyncio.Semaphore(max(1, BATCH_CONCURRENCY))
+
+    # The resume side (sections, entries, skill terms) is parsed once
+    # and shared by every job description
+    local = await run_in_threadpool(parse_resume, request.resume_text)
+
+    async def run(jd):
+
+        async with semaphore:
+
+            try:
+
+                result = await run_in_threadpool(
+                    optimize_resume_ai,
+                    request.resume_text,
+                    jd,
+                    "/resume/optimize/batch",
+                    local=local
+                )
+
+                optimization_id = await run_in_threadpool(
+                    artifacts.save,
+                    result
+                )
+
+                response = summarize_optimization(result)
+                response["optimization_id"] = optimization_id
+
+                return jd, response
+
+            except Exception as e:
+
+                logging.error(f"Batch optimize failed: {e}")
+
+                return jd, None
+
+    async def events():
+
+        tasks = [
+            asyncio.ensure_future(run(jd))
+            for jd in indices
+            if jd
+        ]
+
+        try:
+
+            for future in asyncio.as_completed(tasks):
+
+                jd, response = await future
+
+                for index in indices[jd]:
+
+                    if response is None:
+                        yield sse_event("error", {
+                            "index": index,
+                            "detail": "Resume optimization failed"
+                        })
+                    else:
+                        yield sse_event("result", {"index": index, **response})
+
+            for index in indices.get("", []):
+                yield sse_event("error", {
+                    "index": index,
+                    "detail": "Missing job description"
+                })
+
+            yield sse_event("done", {"count": len(request.job_descriptions)})
+
+        finally:
+
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
+# =====================================================
+# METRICS
+# =====================================================
+
+@app.get("/metrics")
+def prometheus_metrics():
+
+    return PlainTextResponse(
+        metrics.render(),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
+# =====================================================
+# LLM USAGE
+# =====================================================
+
+@app.get("/llm/usage")
+def llm_usage():
+
+    return llm_ledger.snapshot()
+
+
+# =====================================================
+# CACHE STATS (THIS WORKER)
+# =====================================================
+
+@app.get("/cache/stats")
+def cache_stats():
+
+    return cache.stats()
+
+
+# =====================================================
+# STARTUP WARMUP + READINESS
+# =====================================================
+
+WARMUP_CONNECT = os.getenv("WARMUP_CONNECT", "1") != "0"
+WARMUP_CONNECT_TIMEOUT = 3
+
+
+def warm_text_pipeline():
+
+    # Uncached on purpose: exercises pdfminer, then every regex-heavy
+    # step of a request so patterns are compiled before real traffic
+    text = extract_pdf_text(warmup.sample_pdf())
+
+    is_valid_resume(text)
+    generate_job_query(text)
+    parse_resume(text)
+    fast_keyword_match(text, text)
+    compute_match_score(text, text)
+    is_entry_level("Graduate Software Engineer", text)
+
+
+def warm_renderer():
+
+    # Loads the standard font metrics and fills the word-width cache
+    sample = warmup.sample_pdf()
+
+    buffer = build_resume_pdf(parse_resume(extract_pdf_text(sample)))
+    buffer.close()
+
+
+def warm_upstream_clients():
+
+    session = get_session()
+
+    client = get_openai_client() if os.getenv("OPENAI_API_KEY") else None
+
+    if not WARMUP_CONNECT:
+        return
+
+    # Open the TLS connections now; neither call uses quota or tokens
+    session.head(ADZUNA_BASE_URL, timeout=WARMUP_CONNECT_TIMEOUT)
+
+    if client is not None:
+        client.with_options(
+            timeout=WARMUP_CONNECT_TIMEOUT,
+            max_retries=0
+        ).models.list()
+
+
+WARMUP_STEPS = [
+    ("imports", warmup.import_heavy_modules),
+    ("text_pipeline", warm_text_pipeline),
+    ("renderer", warm_renderer),
+    ("upstream_clients", warm_upstream_clients),
+]
+
+
+@app.get("/ready")
+def ready():
+
+    status = warmup.status()
+
+    return JSONResponse(
+        status_code=200 if status["ready"] else 503,
+        content=status
+    )
+
+
 # =====================================================
 # DOWNLOAD OPTIMIZED RESUME
 # =====================================================
 
+def to_resume_data(optimized: dict) -> dict:
+
+    return {
+        "name": optimized.get("name", "Candidate Name"),
+        "contact": optimized.get("contact", "Email • Phone • LinkedIn"),
+        "summary": optimized.get("summary", ""),
+        "skills": optimized.get("skills", []),
+        "experience": optimized.get("experience", []),
+        "projects": optimized.get("projects", []),
+        "education": optimized.get("education", [])
+    }
+
+
+def cached_pdf(resume_data: dict):
+
+    # Repeat downloads of the same resume skip reportlab entirely
+    key = pdf_cache.make_key(resume_data, LAYOUT_VERSION)
+
+    return key, pdf_cache.get(key)
+
+
+def render_and_cache(resume_data: dict, key: str):
+
+    # Runs on a render worker, so the cache write (SQLite) does too
+    buffer = build_resume_pdf(resume_data)
+
+    pdf_cache.store_buffer(key, buffer)
+
+    return buffer
+
+
+async def render_resume(resume_data: dict):
+
+    key, cached = await run_in_threadpool(cached_pdf, resume_data)
+
+    if cached is not None:
+        return io.BytesIO(cached)
+
+    # CPU-bound drawing runs on the bounded render pool, off the event loop
+    try:
+        buffer = await render_pool.submit(render_and_cache, resume_data, key)
+
+    except render_pool.RenderPoolBusy:
+
+        raise HTTPException(
+            status_code=503,
+            detail="PDF renderer is busy, please retry",
+            headers={"Retry-After": str(render_pool.RENDER_RETRY_AFTER)}
+        )
+
+    return buffer
+
+
+def pdf_response(buffer, filename: str = "optimized_resume.pdf"):
+
+    return StreamingResponse(
+        iter_and_close(buffer),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(buffer_size(buffer))
+        }
+    )
+
+
 @app.post("/resume/download")
 async def download_resume(
-    file: UploadFile = File(...),
-    job_description: str = Form(...)
+    file: Optional[UploadFile] = File(None),
+    job_description: Optional[str] = Form(None),
+    optimization_id: Optional[str] = Form(None)
 ):
 
-    if not job_description.strip():
+    # Fast path: render a result already computed by /resume/optimize
+    if optimization_id:
+
+        optimized = await run_in_threadpool(artifacts.load, optimization_id)
+
+        if optimized is None:
+            raise HTTPException(404, "Unknown or expired optimization_id")
+
+        if optimized.get("pending"):
+            raise HTTPException(409, "Optimization still running")
+
+        if optimized.get("failed"):
+            raise HTTPException(422, "Resume optimization failed")
+
+        try:
+
+            async with slot("pdf"):
+                return pdf_response(await render_resume(to_resume_data(optimized)))
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+
+            logging.error(f"Resume generation failed: {e}")
+
+            raise HTTPException(
+                status_code=500,
+                detail="Failed to generate optimized resume"
+            )
+
+    if file is None:
+        raise HTTPException(400, "Missing file or optimization_id")
+
+    if not job_description or not job_description.strip():
         raise HTTPException(400, "Missing job description")
 
     content = await file.read()
@@ -391,13 +1020,7 @@ async def download_resume(
         raise HTTPException(400, "Empty file")
 
     try:
-        text = ""
-        with pdfplumber.open(io.BytesIO(content)) as pdf:
-            for page in pdf.pages:
-                extracted = page.extract_text()
-                if extracted:
-                    text += extracted + "\n"
-        resume_text = text.strip()
+        resume_text = (await run_in_threadpool(read_pdf_text, content)).strip()
     except Exception as e:
         logging.error(f"PDF extraction failed: {e}")
         raise HTTPException(400, "Could not read the PDF file")
@@ -407,28 +1030,18 @@ async def download_resume(
 
     try:
 
-        optimized = optimize_resume_ai(
-            resume_text,
-            job_description
-        )
-
-        resume_data = {
-            "name": optimized.get("name", "Candidate Name"),
-            "contact": optimized.get("contact", "Email • Phone • LinkedIn"),
-            "summary": optimized.get("summary", ""),
-            "skills": optimized.get("skills", []),
-            "experience": optimized.get("experience", []),
-            "projects": optimized.get("projects", []),
-            "education": optimized.get("education", [])
-        }
+        async with slot("llm"):
+            optimized = await run_in_threadpool(
+                optimize_resume_ai,
+                resume_text,
+                job_description,
+                "/resume/download"
+            )
 
-        pdf_path = build_resume_pdf(resume_data)
+        return pdf_response(await render_resume(to_resume_data(optimized)))
 
-        return FileResponse(
-            pdf_path,
-            media_type="application/pdf",
-            filename="optimized_resume.pdf"
-        )
+    except HTTPException:
+        raise
 
     except Exception as e:
 
@@ -438,3 +1051,190 @@ async def download_resume(
             status_code=500,
             detail="Failed to generate optimized resume"
         )
+
+
+# =====================================================
+# DOWNLOAD AS A BACKGROUND TASK (SUBMIT / POLL)
+# =====================================================
+
+def download_pipeline(content: bytes, job_description: str) -> bytes:
+
+    try:
+        resume_text = read_pdf_text(content).strip()
+    except Exception as e:
+        logging.error(f"PDF extraction failed: {e}")
+        raise task_queue.TaskFailed("Could not read the PDF file")
+
+    if not resume_text:
+        raise task_queue.TaskFailed("Could not extract text from PDF")
+
+    optimized = optimize_resume_ai(
+        resume_text,
+        job_description,
+        "/resume/download/tasks"
+    )
+
+    resume_data = to_resume_data(optimized)
+
+    key, cached = cached_pdf(resume_data)
+
+    if cached is not None:
+        return cached
+
+    # Rendered on the shared render pool (waiting for a free worker), so
+    # reportlab concurrency stays at RENDER_WORKERS across both paths
+    buffer = render_pool.run_blocking(render_and_cache, resume_data, key)
+
+    try:
+        buffer.seek(0)
+        return buffer.read()
+    finally:
+        buffer.close()
+
+
+def task_links(task_id: str) -> dict:
+
+    return {
+        "status_url": f"/resume/download/tasks/{task_id}",
+        "result_url": f"/resume/download/tasks/{task_id}/result"
+    }
+
+
+@app.post("/resume/download/tasks", status_code=202)
+async def submit_download_task(
+    file: UploadFile = File(...),
+    job_description: str = Form(...)
+):
+
+    if not job_description.strip():
+        raise HTTPException(400, "Missing job description")
+
+    content = await file.read()
+
+    if not content:
+        raise HTTPException(400, "Empty file")
+
+    if len(content) > MAX_FILE_SIZE:
+        raise HTTPException(400, "Resume too large")
+
+    try:
+
+        task_id = await run_in_threadpool(
+            task_queue.submit,
+            "resume_download",
+            download_pipeline,
+            content,
+            job_description
+        )
+
+    except task_queue.TaskQueueFull:
+
+        raise HTTPException(
+            status_code=503,
+            detail="Too many pending downloads, please retry",
+            headers={"Retry-After": str(task_queue.TASK_RETRY_AFTER)}
+        )
+
+    return {"task_id": task_id, "status": task_queue.QUEUED, **task_links(task_id)}
+
+
+@app.get("/resume/download/tasks/{task_id}")
+async def get_download_task(task_id: str):
+
+    task = await run_in_threadpool(task_queue.status, task_id)
+
+    if task is None:
+        raise HTTPException(404, "Unknown or expired task_id")
+
+    return {**task, **task_links(task_id)}
+
+
+@app.get("/resume/download/tasks/{task_id}/result")
+async def get_download_task_result(task_id: str):
+
+    task = await run_in_threadpool(task_queue.status, task_id)
+
+    if task is None:
+        raise HTTPException(404, "Unknown or expired task_id")
+
+    if task["status"] == task_queue.FAILED:
+        raise HTTPException(422, task["error"] or "Task failed")
+
+    if task["status"] != task_queue.DONE:
+
+        return JSONResponse(
+            status_code=202,
+            content={"status": task["status"]},
+            headers={"Retry-After": "2"}
+        )
+
+    data = await run_in_threadpool(task_queue.result, task_id)
+
+    if data is None:
+        raise HTTPException(404, "Unknown or expired task_id")
+
+    return pdf_response(io.BytesIO(data))
+
+
+# =====================================================
+# BATCH RENDER (STREAMED ZIP)
+# =====================================================
+
+@app.post("/resume/render/batch")
+async def render_resume_batch(request: BatchRenderRequest):
+
+    # Keep at most one job per render worker in flight so a large batch
+    # never trips the pool's backpressure for other requests
+    semaphore = asyncio.Semaphore(render_pool.RENDER_WORKERS)
+
+    async def render(index, resume_data):
+
+        async with semaphore:
+
+            try:
+                return index, await render_resume(to_resume_data(resume_data)), None
+
+            except Exception as e:
+
+                logging.error(f"Batch render failed for #{index}: {e}")
+
+                return index, None, "Failed to generate resume"
+
+    async def archive():
+
+        tasks = [
+            asyncio.ensure_future(render(i, data))
+            for i, data in enumerate(request.resumes, start=1)
+        ]
+
+        zip_stream = ZipStream()
+
+        try:
+
+            # Entries are written in completion order
+            for future in asyncio.as_completed(tasks):
+
+                index, buffer, error = await future
+
+                if error:
+                    yield zip_stream.add_bytes(f"resume_{index}_error.txt", error.encode())
+                    continue
+
+                try:
+                    for chunk in zip_stream.add(f"resume_{index}.pdf", buffer):
+                        yield chunk
+                finally:
+                    buffer.close()
+
+            yield zip_stream.close()
+
+        finally:
+
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(
+        archive(),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="resumes.zip"'}
+    )
@@ -1,44 +1,90 @@
 import os
 import json
-import re
-from openai import OpenAI
+import time
+import random
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+
+from app.services import llm_cache
+from app.services import llm_ledger
+from app.services import metrics
+from app.services.json_stream import IncrementalJSONParser
+from app.services.single_flight import SingleFlight
+from app.services.skills import fast_keyword_match, covered_keywords
+from app.services.resume_parser import (
+    parse_resume,
+    fallback_extract_contact,
+    fallback_extract_name,
+    looks_like_name,
+    NAME_PLACEHOLDER
+)
 
 
 # =====================================================
 # OPENAI CLIENT (SAFE INITIALIZATION)
 # =====================================================
 
+_client = None
+_client_lock = threading.Lock()
+
+
 def get_openai_client():
 
+    global _client
+
     api_key = os.getenv("OPENAI_API_KEY")
 
     if not api_key:
         raise ValueError("OPENAI_API_KEY not found in environment variables")
 
-    return OpenAI(api_key=api_key)
+    # One client per process so its connection pool is reused
+    if _client is None:
+
+        with _client_lock:
+
+            if _client is None:
+
+                # Imported on first use: openai dominates cold-start import time
+                from openai import OpenAI
+
+                _client = OpenAI(api_key=api_key)
+
+    return _client
 
 
 # =====================================================
 # SYSTEM PROMPT
 # =====================================================
 
+# Bump whenever SYSTEM_PROMPT changes (invalidates cached results)
+SYSTEM_PROMPT_VERSION = "4"
+
+# Header, education and dates are parsed locally (resume_parser);
+# the model only rewrites bullets and finds skills.
 SYSTEM_PROMPT = """
 You are a professional FAANG resume editor specializing in junior software engineers and new graduates.
 
-Improve and restructure the resume for a software engineering role.
+The candidate's summary, education and dates are parsed separately. Do NOT return them.
+
+Your job:
+- Rewrite the bullets of each experience entry and project for a software engineering role.
+- Identify important missing skills from the job description.
+- List the candidate's ATS-relevant skills.
 
 IMPORTANT RULES:
 - Preserve truth. Do NOT invent fake experience.
 - Optimize for ATS and FAANG resume standards.
-- Extract contact info if available.
-- Identify important missing skills from the job description.
+- Return one "experience" object per detected entry, in the same order, with the same "index".
+- Include "title" and "company" for a detected entry marked "(header incomplete)", and for every entry if none were detected.
+- Include "name" and "contact" ONLY if they are listed under "Missing header fields".
 
 Return ONLY valid JSON in this EXACT format:
 
 {
   "name": string,
+
   "contact": string,
-  "summary": string,
 
   "missing_skills": [string],
 
@@ -46,10 +92,9 @@ Return ONLY valid JSON in this EXACT format:
 
   "experience": [
     {
+      "index": number,
       "title": string,
       "company": string,
-      "duration": string,
-      "location": string,
       "bullets": [string]
     }
   ],
@@ -59,24 +104,27 @@ Return ONLY valid JSON in this EXACT format:
       "title": string,
       "bullets": [string]
     }
-  ],
-
-  "education": [
-    {
-      "degree": string,
-      "school": string,
-      "duration": string,
-      "location": string
-    }
   ]
 }
 """
 
 
+MODEL = "gpt-4o-mini"
+
+_single_flight = SingleFlight()
+
 # Increased reliability
 MAX_TEXT_LENGTH = 4000
 MAX_TOKENS = 1200
 
+# Retry policy (per-request deadline, exponential backoff + full jitter)
+OPTIMIZE_TIME_BUDGET = float(os.getenv("OPTIMIZE_TIME_BUDGET", "30"))
+MAX_ATTEMPTS = 3
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+MIN_ATTEMPT_TIME = 5.0
+RETRYABLE_STATUS = {408, 409, 429}
+
 
 # =====================================================
 # SAFE LIST
@@ -98,90 +146,174 @@ def safe_list(value, limit=None):
 
 
 # =====================================================
-# FALLBACK CONTACT
+# SAFE JSON PARSE
 # =====================================================
 
-def fallback_extract_contact(resume_text):
-
-    email = re.search(r'[\w\.-]+@[\w\.-]+', resume_text)
-    phone = re.search(r'\+?\d[\d\s\-]{8,}', resume_text)
-    linkedin = re.search(r'linkedin\.com\/\S+', resume_text)
+def safe_json_parse(content):
 
-    parts = []
+    try:
+        return json.loads(content)
 
-    if email:
-        parts.append(email.group())
+    except:
 
-    if phone:
-        parts.append(phone.group())
+        try:
+            start = content.find("{")
+            end = content.rfind("}") + 1
 
-    if linkedin:
-        parts.append(linkedin.group())
+            return json.loads(content[start:end])
 
-    return " | ".join(parts)
+        except:
+            return {}
 
 
 # =====================================================
-# FALLBACK NAME
+# MERGE LLM OUTPUT WITH LOCAL PARSE
 # =====================================================
 
-def fallback_extract_name(resume_text):
+def detected_entries(local):
 
-    for line in resume_text.split("\n")[:5]:
+    # Entries without any bullets mean the local parse failed to split
+    # the section; the model's own entries are used instead
+    if any(entry["bullets"] for entry in local["experience"]):
+        return local["experience"]
 
-        line = line.strip()
+    return []
 
-        if 3 < len(line) < 50 and not any(char.isdigit() for char in line):
 
-            return line
+def missing_header_fields(local):
 
-    return "Candidate Name"
+    missing = []
 
+    if local["name"] == NAME_PLACEHOLDER or not looks_like_name(local["name"]):
+        missing.append("name")
 
-# =====================================================
-# SAFE JSON PARSE
-# =====================================================
+    if not local["contact"]:
+        missing.append("contact")
 
-def safe_json_parse(content):
+    return missing
 
-    try:
-        return json.loads(content)
 
-    except:
+def model_text(entry, field):
 
-        try:
-            start = content.find("{")
-            end = content.rfind("}") + 1
+    value = entry.get(field)
 
-            return json.loads(content[start:end])
+    return value.strip() if isinstance(value, str) else ""
 
-        except:
-            return {}
+
+def merge_with_local(parsed, local):
+
+    rewritten = {}
+
+    for position, entry in enumerate(safe_list(parsed.get("experience"))):
+
+        if not isinstance(entry, dict):
+            continue
+
+        index = entry.get("index")
+
+        rewritten[index if isinstance(index, int) else position] = entry
+
+    entries = detected_entries(local)
+
+    if entries:
+
+        experience = [
+            {
+                **entry,
+                # Header fields the local parse could not split out
+                "title": entry["title"] or model_text(rewritten.get(i, {}), "title"),
+                "company": entry["company"] or model_text(rewritten.get(i, {}), "company"),
+                "bullets": (
+                    safe_list(rewritten.get(i, {}).get("bullets"))
+                    or entry["bullets"]
+                )
+            }
+            for i, entry in enumerate(entries)
+        ]
+
+    elif rewritten:
+
+        experience = [
+            {
+                "title": entry.get("title", ""),
+                "company": entry.get("company", ""),
+                "duration": entry.get("duration", ""),
+                "location": entry.get("location", ""),
+                "bullets": safe_list(entry.get("bullets"))
+            }
+            for entry in rewritten.values()
+        ]
+
+    else:
+        experience = local["experience"]
+
+    missing = missing_header_fields(local)
+
+    return {
+        "name": (
+            model_text(parsed, "name") if "name" in missing else ""
+        ) or local["name"],
+        "contact": (
+            model_text(parsed, "contact") if "contact" in missing else ""
+        ) or local["contact"],
+        "summary": local["summary"],
+        "missing_skills": parsed.get("missing_skills"),
+        "skills": parsed.get("skills"),
+        "experience": experience,
+        "projects": safe_list(parsed.get("projects")) or local["projects"],
+        "education": local["education"],
+    }
 
 
 # =====================================================
 # BUILD SAFE RESPONSE
 # =====================================================
 
-def build_safe_response(parsed, resume_text):
+def build_safe_response(
+    parsed,
+    resume_text,
+    local=None,
+    job_description="",
+    keywords=None
+):
+
+    if local is None:
+        local = parse_resume(resume_text)
+
+    # ATS keywords are matched locally so every path agrees on them;
+    # the model's skills only add job description terms outside the vocabulary
+    if keywords is None:
+        keywords = fast_keyword_match(
+            resume_text,
+            job_description,
+            local.get("skill_terms")
+        )
+
+    merged = merge_with_local(parsed, local)
 
     return {
 
-        "name": parsed.get("name") or fallback_extract_name(resume_text),
+        "name": merged.get("name") or fallback_extract_name(resume_text),
 
-        "contact": parsed.get("contact") or fallback_extract_contact(resume_text),
+        "contact": merged.get("contact") or fallback_extract_contact(resume_text),
 
-        "summary": parsed.get("summary", ""),
+        "summary": merged.get("summary", ""),
 
-        "missing_skills": safe_list(parsed.get("missing_skills"), 8),
+        "missing_skills": safe_list(merged.get("missing_skills"), 8),
 
-        "skills": safe_list(parsed.get("skills"), 12),
+        "skills": safe_list(merged.get("skills"), 12),
 
-        "experience": safe_list(parsed.get("experience"), 3),
+        "experience": safe_list(merged.get("experience"), 3),
 
-        "projects": safe_list(parsed.get("projects"), 3),
+        "projects": safe_list(merged.get("projects"), 3),
 
-        "education": safe_list(parsed.get("education"), 2),
+        "education": safe_list(merged.get("education"), 2),
+
+        "ats_keywords": covered_keywords(
+            keywords["ats_keywords"],
+            safe_list(merged.get("skills")),
+            job_description
+        ),
     }
 
 
@@ -189,81 +321,498 @@ def build_safe_response(parsed, resume_text):
 # FALLBACK RESPONSE
 # =====================================================
 
-def fallback_response(resume_text):
+def fallback_response(resume_text, local=None, job_description=""):
 
-    return {
+    # Locally parsed resume with original bullets and keyword-matched
+    # skills, no LLM output
+    if local is None:
+        local = parse_resume(resume_text)
 
-        "name": fallback_extract_name(resume_text),
+    keywords = fast_keyword_match(
+        resume_text,
+        job_description,
+        local.get("skill_terms")
+    )
 
-        "contact": fallback_extract_contact(resume_text),
+    return build_safe_response(
+        {
+            "missing_skills": keywords["missing_skills"],
+            "skills": keywords["matched_skills"]
+        },
+        resume_text,
+        local,
+        job_description,
+        keywords
+    )
 
-        "summary": "",
 
-        "missing_skills": [],
+# =====================================================
+# PROMPT MESSAGES
+# =====================================================
 
-        "skills": [],
+def describe_entries(local):
 
-        "experience": [],
+    lines = []
 
-        "projects": [],
+    for i, entry in enumerate(detected_entries(local)):
 
-        "education": [],
-    }
+        header = " | ".join(filter(None, [
+            entry["title"],
+            entry["company"],
+            entry["duration"]
+        ]))
+
+        if not entry["title"] or not entry["company"]:
+            header += " (header incomplete)"
+
+        lines.append(f"{i}. {header}")
+
+    return "\n".join(lines) or "(none detected)"
+
+
+def build_messages(resume_text, job_description, local=None):
+
+    if local is None:
+        local = parse_resume(resume_text)
+
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+
+        {
+            "role": "user",
+            "content": f"""
+Resume:
+{resume_text[:MAX_TEXT_LENGTH]}
+
+Detected experience entries:
+{describe_entries(local)}
+
+Missing header fields:
+{", ".join(missing_header_fields(local)) or "(none)"}
+
+Job Description:
+{job_description[:MAX_TEXT_LENGTH]}
+"""
+        }
+    ]
+
+
+def result_cache_key(resume_text, job_description):
+
+    return llm_cache.make_key(
+        resume_text[:MAX_TEXT_LENGTH],
+        job_description[:MAX_TEXT_LENGTH],
+        MODEL,
+        SYSTEM_PROMPT_VERSION
+    )
 
 
 # =====================================================
 # MAIN OPTIMIZER (PRODUCTION SAFE)
 # =====================================================
 
-def optimize_resume_ai(resume_text, job_description):
+def usage_tokens(usage):
+
+    if usage is None:
+        return 0, 0
+
+    return (
+        getattr(usage, "prompt_tokens", 0) or 0,
+        getattr(usage, "completion_tokens", 0) or 0
+    )
+
+
+# =====================================================
+# RETRY POLICY
+# =====================================================
+
+def retry_after_seconds(error):
+
+    response = getattr(error, "response", None)
+
+    if response is None:
+        return None
+
+    headers = response.headers
+
+    try:
+
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+
+        value = headers.get("retry-after")
+
+        if not value:
+            return None
+
+        try:
+            return float(value)
+        except ValueError:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+
+    except Exception:
+        return None
+
+
+def is_retryable(error):
+
+    from openai import APIStatusError, APIConnectionError
+
+    if isinstance(error, APIConnectionError):
+        return True
+
+    if isinstance(error, APIStatusError):
+        return error.status_code in RETRYABLE_STATUS or error.status_code >= 500
+
+    return False
+
+
+def backoff_delay(attempt, error=None):
+
+    delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+    retry_after = retry_after_seconds(error) if error is not None else None
+
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+
+    return delay
+
+
+def request_completion(
+    resume_text,
+    job_description,
+    endpoint="optimize",
+    deadline=None,
+    local=None
+):
+
+    if deadline is None:
+        deadline = time.monotonic() + OPTIMIZE_TIME_BUDGET
 
     client = get_openai_client()
 
     parsed = {}
 
-    # Retry logic (2 attempts)
-    for attempt in range(2):
+    attempts = 0
+    prompt_tokens = 0
+    completion_tokens = 0
+
+    started = time.perf_counter()
+
+    for attempt in range(MAX_ATTEMPTS):
+
+        remaining = deadline - time.monotonic()
+
+        # Never start an attempt that cannot finish in time
+        if remaining < MIN_ATTEMPT_TIME:
+            break
+
+        attempts += 1
+
+        error = None
 
         try:
 
-            response = client.chat.completions.create(
+            response = client.with_options(
+                timeout=remaining,
+                max_retries=0
+            ).chat.completions.create(
 
-                model="gpt-4o-mini",
+                model=MODEL,
 
                 temperature=0,
 
                 response_format={"type": "json_object"},
 
-                messages=[
-                    {"role": "system", "content": SYSTEM_PROMPT},
-
-                    {
-                        "role": "user",
-                        "content": f"""
-Resume:
-{resume_text[:MAX_TEXT_LENGTH]}
-
-Job Description:
-{job_description[:MAX_TEXT_LENGTH]}
-"""
-                    }
-                ],
+                messages=build_messages(resume_text, job_description, local),
 
                 max_tokens=MAX_TOKENS
             )
 
+            prompt, completion = usage_tokens(response.usage)
+
+            prompt_tokens += prompt
+            completion_tokens += completion
+
             content = response.choices[0].message.content.strip()
 
             parsed = safe_json_parse(content)
 
-            print("AI parsed result:", parsed)
-
             if parsed:
-                return build_safe_response(parsed, resume_text)
+                break
 
         except Exception as e:
 
-            print(f"❌ OpenAI attempt {attempt+1} failed:", e)
+            logging.warning(f"OpenAI attempt {attempt+1} failed: {e}")
+
+            metrics.UPSTREAM_ERRORS.inc(upstream="openai")
+
+            if not is_retryable(e):
+                break
+
+            error = e
+
+        if attempt == MAX_ATTEMPTS - 1:
+            break
+
+        delay = backoff_delay(attempt, error)
+
+        if time.monotonic() + delay + MIN_ATTEMPT_TIME > deadline:
+            break
+
+        time.sleep(delay)
+
+    llm_ledger.record(
+        endpoint=endpoint,
+        model=MODEL,
+        attempts=attempts,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        latency=time.perf_counter() - started,
+        parse_ok=bool(parsed)
+    )
+
+    return parsed
+
+
+def record_cache_hit(endpoint):
+
+    llm_ledger.record(
+        endpoint=endpoint,
+        model=MODEL,
+        attempts=0,
+        prompt_tokens=0,
+        completion_tokens=0,
+        latency=0.0,
+        parse_ok=True,
+        cached=True
+    )
+
+
+@metrics.stage("optimize_resume_ai")
+def optimize_resume_ai(
+    resume_text,
+    job_description,
+    endpoint="optimize",
+    time_budget=OPTIMIZE_TIME_BUDGET,
+    local=None
+):
+
+    deadline = time.monotonic() + time_budget
+
+    # Stage 1: deterministic local extraction (header, education, dates).
+    # Callers optimizing one resume many times pass it in
+    if local is None:
+        local = parse_resume(resume_text)
+
+    cache_key = result_cache_key(resume_text, job_description)
+
+    cached = llm_cache.get(cache_key)
+
+    if cached:
+
+        record_cache_hit(endpoint)
+
+        return build_safe_response(cached, resume_text, local, job_description)
+
+    def run():
+
+        parsed = request_completion(
+            resume_text,
+            job_description,
+            endpoint,
+            deadline,
+            local
+        )
+
+        if parsed:
+            llm_cache.put(cache_key, parsed)
+
+        return parsed
+
+    # Identical concurrent requests share one upstream call
+    parsed = _single_flight.do(
+        cache_key,
+        run,
+        lookup=lambda: llm_cache.peek(cache_key),
+        timeout=max(0.0, deadline - time.monotonic())
+    )
+
+    if parsed:
+        return build_safe_response(parsed, resume_text, local, job_description)
 
     # Final fallback
-    return fallback_response(resume_text)
+    return fallback_response(resume_text, local, job_description)
+
+
+# =====================================================
+# STREAMING OPTIMIZER
+# =====================================================
+
+def is_streamed_field(path):
+
+    if path in (("missing_skills",), ("skills",)):
+        return True
+
+    # experience[i].bullets[j]
+    return (
+        len(path) == 4
+        and path[0] == "experience"
+        and path[2] == "bullets"
+        and isinstance(path[3], int)
+    )
+
+
+def field_event(path, value):
+
+    if path[0] == "experience":
+
+        return "bullet", {
+            "experience_index": path[1],
+            "bullet_index": path[3],
+            "text": value
+        }
+
+    return path[0], value
+
+
+def replay_fields(parsed):
+
+    for field in ("missing_skills", "skills"):
+
+        if field in parsed:
+            yield field_event((field,), parsed[field])
+
+    for i, job in enumerate(safe_list(parsed.get("experience"))):
+
+        if not isinstance(job, dict):
+            continue
+
+        for j, bullet in enumerate(safe_list(job.get("bullets"))):
+            yield field_event(("experience", i, "bullets", j), bullet)
+
+
+def stream_optimize_resume_ai(
+    resume_text,
+    job_description,
+    endpoint="optimize_stream",
+    time_budget=OPTIMIZE_TIME_BUDGET
+):
+    """
+    Generator yielding (event, data) tuples while the completion streams.
+
+    Emits "missing_skills", "skills" and "bullet" events as soon as each
+    field is complete, then a final "result" with the full safe response.
+    """
+
+    cache_key = result_cache_key(resume_text, job_description)
+
+    local = parse_resume(resume_text)
+
+    cached = llm_cache.get(cache_key)
+
+    if cached:
+
+        record_cache_hit(endpoint)
+
+        yield from replay_fields(cached)
+
+        yield "result", build_safe_response(cached, resume_text, local, job_description)
+
+        return
+
+    parser = IncrementalJSONParser(is_streamed_field)
+
+    content = ""
+
+    prompt_tokens = 0
+    completion_tokens = 0
+
+    started = time.perf_counter()
+
+    deadline = time.monotonic() + time_budget
+
+    stream = None
+
+    try:
+
+        client = get_openai_client()
+
+        stream = client.with_options(
+            timeout=time_budget,
+            max_retries=0
+        ).chat.completions.create(
+
+            model=MODEL,
+
+            temperature=0,
+
+            response_format={"type": "json_object"},
+
+            messages=build_messages(resume_text, job_description, local),
+
+            max_tokens=MAX_TOKENS,
+
+            stream=True,
+
+            stream_options={"include_usage": True}
+        )
+
+        for chunk in stream:
+
+            # Final chunk carries usage only
+            if getattr(chunk, "usage", None):
+                prompt_tokens, completion_tokens = usage_tokens(chunk.usage)
+
+            if not chunk.choices:
+                continue
+
+            delta = chunk.choices[0].delta.content
+
+            if not delta:
+                continue
+
+            content += delta
+
+            for path, value in parser.feed(delta):
+                yield field_event(path, value)
+
+            if time.monotonic() > deadline:
+                logging.warning("OpenAI stream exceeded time budget")
+                break
+
+    except Exception as e:
+
+        logging.warning(f"OpenAI stream failed: {e}")
+
+        metrics.UPSTREAM_ERRORS.inc(upstream="openai")
+
+    finally:
+
+        # Release the pooled connection when we stop early (time budget,
+        # client disconnect) instead of leaving it to garbage collection
+        if stream is not None:
+            stream.close()
+
+    parsed = safe_json_parse(content.strip())
+
+    llm_ledger.record(
+        endpoint=endpoint,
+        model=MODEL,
+        attempts=1,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        latency=time.perf_counter() - started,
+        parse_ok=bool(parsed)
+    )
+
+    if not parsed:
+
+        yield "result", fallback_response(resume_text, local, job_description)
+
+        return
+
+    llm_cache.put(cache_key, parsed)
+
+    yield "result", build_safe_response(parsed, resume_text, local, job_description)
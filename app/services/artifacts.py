@@ -0,0 +1,101 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import logging
+import threading
+
+
+# =====================================================
+# GradHire Optimization Artifacts
+# Full optimizer results stored under an optimization_id
+# so /resume/download can render without re-running the LLM
+# =====================================================
+
+ARTIFACTS_PATH = os.getenv("ARTIFACTS_PATH", "/tmp/gradhire_artifacts.sqlite3")
+ARTIFACT_TTL = int(os.getenv("ARTIFACT_TTL", str(24 * 60 * 60)))
+
+_lock = threading.Lock()
+_conn = None
+
+
+def _get_conn():
+
+    global _conn
+
+    if _conn is None:
+
+        _conn = sqlite3.connect(
+            ARTIFACTS_PATH,
+            timeout=5,
+            check_same_thread=False
+        )
+
+        _conn.execute("PRAGMA journal_mode=WAL")
+
+        _conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS artifacts (
+                id TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                expires REAL NOT NULL
+            )
+            """
+        )
+
+        _conn.commit()
+
+    return _conn
+
+
+# =====================================================
+# SAVE / LOAD
+# =====================================================
+
+def new_id() -> str:
+
+    return uuid.uuid4().hex
+
+
+def save(payload: dict, artifact_id: str = None) -> str:
+
+    artifact_id = artifact_id or new_id()
+
+    now = time.time()
+
+    with _lock:
+
+        conn = _get_conn()
+
+        conn.execute("DELETE FROM artifacts WHERE expires < ?", (now,))
+
+        conn.execute(
+            "INSERT OR REPLACE INTO artifacts (id, payload, expires) "
+            "VALUES (?, ?, ?)",
+            (artifact_id, json.dumps(payload), now + ARTIFACT_TTL)
+        )
+
+        conn.commit()
+
+    return artifact_id
+
+
+def load(artifact_id: str):
+
+    try:
+
+        with _lock:
+
+            row = _get_conn().execute(
+                "SELECT payload FROM artifacts WHERE id = ? AND expires >= ?",
+                (artifact_id, time.time())
+            ).fetchone()
+
+    except Exception as e:
+
+        logging.warning(f"Artifact lookup failed: {e}")
+
+        return None
+
+    return json.loads(row[0]) if row else None
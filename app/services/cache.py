@@ -0,0 +1,421 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+
+from app.services import metrics
+
+
+# =====================================================
+# GradHire Tiered Cache
+# Per-namespace cache with two tiers:
+#   - an in-process LRU (bytes-bounded, per worker)
+#   - a shared SQLite (WAL) store every worker on the node reads
+# Entries carry a TTL; both tiers are size-bounded per namespace.
+# Calls block on SQLite: use them from worker threads, never
+# directly on the event loop
+# =====================================================
+
+CACHE_PATH = os.getenv("CACHE_PATH", "/tmp/gradhire_cache.sqlite3")
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "1") != "0"
+
+# Shared-tier hits refresh last_access at most this often per entry, so
+# reads rarely need the WAL write lock (eviction order is this coarse)
+ACCESS_UPDATE_INTERVAL = 60
+
+CACHE_REQUESTS = metrics.Counter(
+    "gradhire_cache_requests_total",
+    "Cache lookups by namespace and result (local_hit, shared_hit, miss).",
+    ["namespace", "result"]
+)
+
+CACHE_LOCAL_BYTES = metrics.Gauge(
+    "gradhire_cache_local_bytes",
+    "Bytes held by the in-process cache tier.",
+    ["namespace"]
+)
+
+# One connection per worker process, shared by every namespace
+_conn_lock = threading.Lock()
+_conn = None
+
+NAMESPACES = {}
+
+
+def _get_conn():
+
+    global _conn
+
+    if _conn is None:
+
+        _conn = sqlite3.connect(
+            CACHE_PATH,
+            timeout=5,
+            check_same_thread=False
+        )
+
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+
+        _conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cache (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires REAL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            )
+            """
+        )
+
+        _conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_cache_access "
+            "ON cache (namespace, last_access)"
+        )
+
+        _conn.commit()
+
+    return _conn
+
+
+# =====================================================
+# CODECS (VALUES ARE STORED SERIALIZED IN BOTH TIERS)
+# =====================================================
+
+def _encode(value, codec):
+
+    if codec == "bytes":
+        return bytes(value)
+
+    if codec == "text":
+        return value.encode("utf-8")
+
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def _decode(data, codec):
+
+    if codec == "bytes":
+        return data
+
+    if codec == "text":
+        return data.decode("utf-8")
+
+    return json.loads(data)
+
+
+# =====================================================
+# TIERED CACHE
+# =====================================================
+
+class TieredCache:
+
+    def __init__(
+        self,
+        namespace,
+        ttl=None,
+        local_max_bytes=8 * 1024 * 1024,
+        shared_max_bytes=64 * 1024 * 1024,
+        max_item_bytes=None,
+        codec="json",
+        enabled=True
+    ):
+        """
+        `ttl` is in seconds (None never expires). `codec` is one of
+        "json", "text" or "bytes". Setting `local_max_bytes` or
+        `shared_max_bytes` to 0 disables that tier.
+        """
+
+        self.namespace = namespace
+        self.ttl = ttl
+        self.local_max_bytes = local_max_bytes
+        self.shared_max_bytes = shared_max_bytes
+        self.max_item_bytes = max_item_bytes
+        self.codec = codec
+        self.enabled = enabled and CACHE_ENABLED
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._local_bytes = 0
+
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+        NAMESPACES[namespace] = self
+
+
+    # =====================================================
+    # Public API
+    # =====================================================
+
+    def get(self, key):
+
+        if not self.enabled:
+            return None
+
+        value, result = self._lookup(key)
+
+        self._count(result)
+
+        return value
+
+
+    def peek(self, key):
+        """
+        Like get(), but not counted in the hit / miss stats. For
+        repeated polling (e.g. waiting on another worker's result).
+        """
+
+        if not self.enabled:
+            return None
+
+        value, _ = self._lookup(key)
+
+        return value
+
+
+    def put(self, key, value):
+
+        if not self.enabled:
+            return
+
+        try:
+            data = _encode(value, self.codec)
+        except Exception as e:
+            logging.warning(f"Cache encode failed ({self.namespace}): {e}")
+            return
+
+        if self.max_item_bytes is not None and len(data) > self.max_item_bytes:
+            return
+
+        expires = time.time() + self.ttl if self.ttl is not None else None
+
+        self._local_put(key, data, expires)
+        self._shared_put(key, data, expires)
+
+
+    def stats(self):
+
+        lookups = self.local_hits + self.shared_hits + self.misses
+
+        return {
+            "local_hits": self.local_hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "hit_rate": round(
+                (self.local_hits + self.shared_hits) / lookups, 4
+            ) if lookups else 0.0,
+            "local_bytes": self._local_bytes,
+            "local_entries": len(self._entries),
+        }
+
+
+    def _lookup(self, key):
+
+        data = self._local_get(key)
+
+        if data is not None:
+            return _decode(data, self.codec), "local_hit"
+
+        data, expires = self._shared_get(key)
+
+        if data is None:
+            return None, "miss"
+
+        # Promote so the next hit in this worker skips SQLite
+        self._local_put(key, data, expires)
+
+        return _decode(data, self.codec), "shared_hit"
+
+
+    def _count(self, result):
+
+        with self._lock:
+
+            if result == "local_hit":
+                self.local_hits += 1
+            elif result == "shared_hit":
+                self.shared_hits += 1
+            else:
+                self.misses += 1
+
+        CACHE_REQUESTS.inc(namespace=self.namespace, result=result)
+
+
+    # =====================================================
+    # In-process tier (LRU by total bytes)
+    # =====================================================
+
+    def _local_get(self, key):
+
+        with self._lock:
+
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            data, expires = entry
+
+            if expires is not None and expires < time.time():
+                self._local_remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+
+            return data
+
+
+    def _local_put(self, key, data, expires):
+
+        if len(data) > self.local_max_bytes:
+            return
+
+        with self._lock:
+
+            self._local_remove(key)
+
+            self._entries[key] = (data, expires)
+            self._local_bytes += len(data)
+
+            while self._local_bytes > self.local_max_bytes and self._entries:
+                _, (evicted, _expires) = self._entries.popitem(last=False)
+                self._local_bytes -= len(evicted)
+
+            CACHE_LOCAL_BYTES.set(self._local_bytes, namespace=self.namespace)
+
+
+    def _local_remove(self, key):
+
+        entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            self._local_bytes -= len(entry[0])
+
+
+    # =====================================================
+    # Shared tier (SQLite, LRU by last access per namespace)
+    # =====================================================
+
+    def _shared_get(self, key):
+
+        if not self.shared_max_bytes:
+            return None, None
+
+        now = time.time()
+
+        try:
+
+            with _conn_lock:
+
+                conn = _get_conn()
+
+                row = conn.execute(
+                    "SELECT value, expires, last_access FROM cache "
+                    "WHERE namespace = ? AND key = ? "
+                    "AND (expires IS NULL OR expires >= ?)",
+                    (self.namespace, key, now)
+                ).fetchone()
+
+                if row is None:
+                    return None, None
+
+                if now - row[2] >= ACCESS_UPDATE_INTERVAL:
+
+                    conn.execute(
+                        "UPDATE cache SET last_access = ? "
+                        "WHERE namespace = ? AND key = ?",
+                        (now, self.namespace, key)
+                    )
+
+                    conn.commit()
+
+            return bytes(row[0]), row[1]
+
+        except Exception as e:
+
+            logging.warning(f"Shared cache read failed ({self.namespace}): {e}")
+
+            return None, None
+
+
+    def _shared_put(self, key, data, expires):
+
+        if len(data) > self.shared_max_bytes:
+            return
+
+        now = time.time()
+
+        try:
+
+            with _conn_lock:
+
+                conn = _get_conn()
+
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache "
+                    "(namespace, key, value, size, expires, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (self.namespace, key, sqlite3.Binary(data), len(data), expires, now)
+                )
+
+                self._shared_evict(conn, now)
+
+                conn.commit()
+
+        except Exception as e:
+
+            logging.warning(f"Shared cache write failed ({self.namespace}): {e}")
+
+
+    def _shared_evict(self, conn, now):
+
+        conn.execute(
+            "DELETE FROM cache WHERE namespace = ? AND expires < ?",
+            (self.namespace, now)
+        )
+
+        total = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache WHERE namespace = ?",
+            (self.namespace,)
+        ).fetchone()[0]
+
+        if total <= self.shared_max_bytes:
+            return
+
+        rows = conn.execute(
+            "SELECT key, size FROM cache WHERE namespace = ? "
+            "ORDER BY last_access ASC",
+            (self.namespace,)
+        ).fetchall()
+
+        for key, size in rows:
+
+            if total <= self.shared_max_bytes:
+                break
+
+            conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            )
+
+            total -= size
+
+
+# =====================================================
+# STATS (PER WORKER)
+# =====================================================
+
+def stats() -> dict:
+
+    return {
+        name: cache.stats()
+        for name, cache in NAMESPACES.items()
+    }
@@ -1,6 +1,8 @@
 import re
 from typing import Dict
 
+from app.services import metrics
+
 # =====================================================
 # GradHire Production Domain Classifier v2
 # Accurate, Stable, Launch-Ready
@@ -174,6 +176,7 @@ def detect_specialization(resume_text: str) -> str:
 # Public API used by main.py
 # =====================================================
 
+@metrics.stage("generate_job_query")
 def generate_job_query(resume_text: str) -> str:
 
     try:
@@ -0,0 +1,204 @@
+import os
+import gzip
+import json
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+# Optional: faster JSON encoding / brotli support when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# =====================================================
+# GradHire Response Encoding
+# Fast JSON rendering (orjson when installed) and
+# negotiated gzip / brotli for large, non-streamed bodies
+# =====================================================
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+
+# Tuned for per-request speed rather than ratio
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+COMPRESSIBLE_TYPES = (
+    b"application/json",
+    b"text/plain",
+    b"text/html",
+)
+
+
+class FastJSONResponse(JSONResponse):
+
+    def render(self, content: Any) -> bytes:
+
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":")
+        ).encode("utf-8")
+
+
+# =====================================================
+# CONTENT NEGOTIATION
+# =====================================================
+
+def _accepted_encodings(header: str) -> dict:
+
+    accepted = {}
+
+    for part in header.split(","):
+
+        name, _, params = part.strip().partition(";")
+
+        if not name:
+            continue
+
+        quality = 1.0
+
+        params = params.strip()
+
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+
+        accepted[name.strip().lower()] = quality
+
+    return accepted
+
+
+def choose_encoding(header: str):
+
+    accepted = _accepted_encodings(header)
+
+    wildcard = accepted.get("*", 0.0)
+
+    # In preference order: br wins ties
+    supported = ["br", "gzip"] if brotli is not None else ["gzip"]
+
+    best, best_quality = None, 0.0
+
+    for encoding in supported:
+
+        quality = accepted.get(encoding, wildcard)
+
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+# =====================================================
+# ASGI MIDDLEWARE
+# =====================================================
+
+class CompressionMiddleware:
+    """
+    Compresses single-message responses (regular JSON / text bodies).
+    Streamed responses (SSE, PDF, ZIP) pass through untouched so they
+    keep flushing incrementally.
+    """
+
+    def __init__(self, app, minimum_size=COMPRESSION_MIN_SIZE):
+
+        self.app = app
+        self.minimum_size = minimum_size
+
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept = ""
+
+        for name, value in scope.get("headers", []):
+            if name == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+
+        encoding = choose_encoding(accept) if accept else None
+
+        start = None
+        passthrough = False
+
+        async def send_wrapper(message):
+
+            nonlocal start, passthrough
+
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+
+                start = message
+
+                headers = dict(start.get("headers", []))
+
+                content_type = headers.get(b"content-type", b"")
+
+                if (
+                    b"content-encoding" in headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                ):
+                    passthrough = True
+                    await send(start)
+
+                return
+
+            # First body message: compress only complete, large bodies
+            body = message.get("body", b"")
+
+            if message.get("more_body", False):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            vary = b"Accept-Encoding"
+
+            headers = []
+
+            for name, value in start.get("headers", []):
+
+                if name == b"vary":
+                    vary = value + b", Accept-Encoding"
+                elif name != b"content-length":
+                    headers.append((name, value))
+
+            headers.append((b"vary", vary))
+
+            if encoding is not None and len(body) >= self.minimum_size:
+                body = compress(body, encoding)
+                headers.append((b"content-encoding", encoding.encode("latin-1")))
+
+            headers.append((b"content-length", str(len(body)).encode("latin-1")))
+
+            await send({**start, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
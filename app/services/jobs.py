@@ -1,21 +1,61 @@
 import os
-import requests
 import re
+import time
 import uuid
 import logging
 from dotenv import load_dotenv
 
+from app.services import metrics
+from app.services.cache import TieredCache
+
 load_dotenv()
 
 ADZUNA_APP_ID = os.getenv("ADZUNA_APP_ID")
 ADZUNA_API_KEY = os.getenv("ADZUNA_API_KEY")
 
+# Overridable so load tests can point at a local stand-in
+ADZUNA_BASE_URL = os.getenv(
+    "ADZUNA_BASE_URL",
+    "https://api.adzuna.com/v1/api/jobs"
+).rstrip("/")
+
 REQUEST_TIMEOUT = 6
 MAX_DESCRIPTION_LENGTH = 1800
 MAX_JOBS_RETURNED = 20
 MAX_PAGES_TO_SCAN = 4
 MAX_RETRIES = 2
 
+ADZUNA_CACHE_TTL = int(os.getenv("ADZUNA_CACHE_TTL", "900"))
+
+# Raw Adzuna pages, shared by all workers (listings change slowly)
+adzuna_cache = TieredCache(
+    "adzuna",
+    ttl=ADZUNA_CACHE_TTL,
+    local_max_bytes=8 * 1024 * 1024,
+    shared_max_bytes=64 * 1024 * 1024
+)
+
+
+# =====================================================
+# HTTP SESSION
+# =====================================================
+
+_session = None
+
+
+def get_session():
+
+    global _session
+
+    # Shared keep-alive pool; requests is imported on first use
+    if _session is None:
+
+        import requests
+
+        _session = requests.Session()
+
+    return _session
+
 
 # =====================================================
 # STOPWORDS
@@ -214,6 +254,49 @@ def clean_description(text: str):
     return text[:MAX_DESCRIPTION_LENGTH]
 
 
+# =====================================================
+# SEARCH FILTERS (PUSHED DOWN TO ADZUNA)
+# =====================================================
+
+CONTRACT_TYPES = {"permanent", "contract"}
+CONTRACT_TIMES = {"full_time", "part_time"}
+
+
+def build_filters(
+    where: str = None,
+    distance: int = None,
+    salary_min: int = None,
+    contract_type: str = None,
+    contract_time: str = None
+) -> dict:
+
+    filters = {}
+
+    if where and where.strip():
+        filters["where"] = where.strip()
+
+        # Adzuna ignores distance without a location
+        if distance:
+            filters["distance"] = int(distance)
+
+    if salary_min:
+        filters["salary_min"] = int(salary_min)
+
+    # Adzuna takes these as flags, e.g. permanent=1, full_time=1
+    if contract_type in CONTRACT_TYPES:
+        filters[contract_type] = 1
+
+    if contract_time in CONTRACT_TIMES:
+        filters[contract_time] = 1
+
+    return filters
+
+
+def filters_key(filters: dict) -> str:
+
+    return "&".join(f"{name}={filters[name]}" for name in sorted(filters))
+
+
 # =====================================================
 # FETCH JOBS
 # =====================================================
@@ -222,9 +305,12 @@ def fetch_jobs(
     query: str,
     country: str = "in",
     limit: int = MAX_JOBS_RETURNED,
-    resume_text: str = ""
+    resume_text: str = "",
+    filters: dict = None
 ):
 
+    filters = filters or {}
+
     if not ADZUNA_APP_ID or not ADZUNA_API_KEY:
         logging.error("Missing Adzuna API keys")
         return []
@@ -256,34 +342,49 @@ def fetch_jobs(
 
         for page in range(1, MAX_PAGES_TO_SCAN + 1):
 
-            url = f"https://api.adzuna.com/v1/api/jobs/{country}/search/{page}"
+            url = f"{ADZUNA_BASE_URL}/{country}/search/{page}"
 
             params = {
                 "app_id": ADZUNA_APP_ID,
                 "app_key": ADZUNA_API_KEY,
                 "what": q,
                 "results_per_page": 20,
-                "sort_by": "date"
+                "sort_by": "date",
+                **filters
             }
 
-            try:
+            cache_key = f"{country}:{page}:{q}:{filters_key(filters)}"
 
-                response = requests.get(
-                    url,
-                    params=params,
-                    timeout=REQUEST_TIMEOUT
-                )
+            data = adzuna_cache.get(cache_key)
+
+            if data is None:
 
-                response.raise_for_status()
+                try:
 
-                data = response.json()
+                    with metrics.stage("adzuna_request"):
 
-            except Exception as e:
+                        response = get_session().get(
+                            url,
+                            params=params,
+                            timeout=REQUEST_TIMEOUT
+                        )
 
-                logging.warning(f"Adzuna fetch failed: {str(e)}")
+                        response.raise_for_status()
 
-                continue
+                        data = response.json()
 
+                except Exception as e:
+
+                    logging.warning(f"Adzuna fetch failed: {str(e)}")
+
+                    metrics.UPSTREAM_ERRORS.inc(upstream="adzuna")
+
+                    continue
+
+                adzuna_cache.put(cache_key, data)
+
+
+            batch_started = time.perf_counter()
 
             for job in data.get("results", []):
 
@@ -335,6 +436,11 @@ def fetch_jobs(
                 if len(collected_jobs) >= limit:
                     break
 
+            metrics.STAGE_DURATION.observe(
+                time.perf_counter() - batch_started,
+                stage="compute_match_score_batch"
+            )
+
             if len(collected_jobs) >= limit:
                 break
 
@@ -0,0 +1,171 @@
+import json
+from typing import Callable, List, Tuple
+
+
+# =====================================================
+# GradHire Incremental JSON Parser
+# Emits values as soon as they are complete in a stream
+# =====================================================
+
+WHITESPACE = " \t\r\n"
+
+
+class IncrementalJSONParser:
+    """
+    Feed JSON text chunk by chunk and collect every completed value
+    whose path matches `watch`.
+
+    Paths are tuples of object keys and array indices, e.g.
+    ("experience", 0, "bullets", 2).
+    """
+
+    def __init__(self, watch: Callable[[tuple], bool]):
+
+        self.watch = watch
+
+        self._text = ""
+        self._pos = 0
+
+        # Container frames: {"kind", "path", "start", "key", "expect_key"}
+        self._stack = []
+
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._string_start = 0
+        self._string_path = ()
+
+        self._scalar_start = None
+        self._scalar_path = ()
+
+
+    # =====================================================
+    # Public API
+    # =====================================================
+
+    def feed(self, chunk: str) -> List[Tuple[tuple, object]]:
+
+        events = []
+
+        self._text += chunk
+
+        text = self._text
+
+        for i in range(self._pos, len(text)):
+            self._step(text, i, text[i], events)
+
+        self._pos = len(text)
+
+        return events
+
+
+    # =====================================================
+    # Helpers
+    # =====================================================
+
+    def _current_path(self):
+
+        return tuple(frame["key"] for frame in self._stack)
+
+
+    def _complete(self, path, start, end, events):
+
+        if not self.watch(path):
+            return
+
+        try:
+            events.append((path, json.loads(self._text[start:end])))
+        except ValueError:
+            pass
+
+
+    def _step(self, text, i, c, events):
+
+        # Inside a string literal
+        if self._in_string:
+
+            if self._escape:
+                self._escape = False
+
+            elif c == "\\":
+                self._escape = True
+
+            elif c == '"':
+
+                self._in_string = False
+
+                if self._string_is_key:
+                    self._stack[-1]["key"] = json.loads(
+                        text[self._string_start:i + 1]
+                    )
+                else:
+                    self._complete(
+                        self._string_path, self._string_start, i + 1, events
+                    )
+
+            return
+
+        # Inside a number / true / false / null
+        if self._scalar_start is not None:
+
+            if c not in WHITESPACE and c not in ",]}":
+                return
+
+            self._complete(self._scalar_path, self._scalar_start, i, events)
+
+            self._scalar_start = None
+
+        top = self._stack[-1] if self._stack else None
+
+        if c in WHITESPACE:
+            return
+
+        if c == '"':
+
+            self._in_string = True
+            self._string_start = i
+            self._string_is_key = bool(
+                top and top["kind"] == "object" and top["expect_key"]
+            )
+            self._string_path = self._current_path()
+
+        elif c in "{[":
+
+            kind = "object" if c == "{" else "array"
+
+            self._stack.append({
+                "kind": kind,
+                "path": self._current_path(),
+                "start": i,
+                "key": None if kind == "object" else 0,
+                "expect_key": kind == "object",
+            })
+
+        elif c in "}]":
+
+            if not self._stack:
+                return
+
+            frame = self._stack.pop()
+
+            self._complete(frame["path"], frame["start"], i + 1, events)
+
+        elif c == ":":
+
+            if top:
+                top["expect_key"] = False
+
+        elif c == ",":
+
+            if not top:
+                return
+
+            if top["kind"] == "object":
+                top["expect_key"] = True
+            else:
+                top["key"] += 1
+
+        else:
+
+            self._scalar_start = i
+            self._scalar_path = self._current_path()
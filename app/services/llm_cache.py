@@ -0,0 +1,57 @@
+import os
+import json
+import hashlib
+
+from app.services.cache import TieredCache
+
+
+# =====================================================
+# GradHire LLM Result Cache
+# "llm" namespace of the tiered cache: per-worker LRU in
+# front of the node-wide SQLite store (LRU by last access)
+# =====================================================
+
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+LLM_CACHE_LOCAL_BYTES = int(os.getenv("LLM_CACHE_LOCAL_BYTES", str(4 * 1024 * 1024)))
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "1") != "0"
+
+_cache = TieredCache(
+    "llm",
+    local_max_bytes=LLM_CACHE_LOCAL_BYTES,
+    shared_max_bytes=LLM_CACHE_MAX_BYTES,
+    enabled=LLM_CACHE_ENABLED
+)
+
+
+# =====================================================
+# CACHE KEY
+# =====================================================
+
+def make_key(resume_text, job_description, model, prompt_version):
+
+    payload = json.dumps(
+        [resume_text, job_description, model, prompt_version],
+        ensure_ascii=False
+    )
+
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# =====================================================
+# GET / PUT
+# =====================================================
+
+def get(key):
+
+    return _cache.get(key)
+
+
+def peek(key):
+
+    # Uncounted lookup, for polling
+    return _cache.peek(key)
+
+
+def put(key, value):
+
+    _cache.put(key, value)
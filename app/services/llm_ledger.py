@@ -0,0 +1,179 @@
+import os
+import json
+import time
+import bisect
+import logging
+import threading
+from logging.handlers import RotatingFileHandler
+
+
+# =====================================================
+# GradHire LLM Ledger
+# Per-call token / latency records + in-memory aggregates
+# =====================================================
+
+LLM_LEDGER_PATH = os.getenv("LLM_LEDGER_PATH", "/tmp/gradhire_llm_ledger.jsonl")
+LLM_LEDGER_MAX_BYTES = int(os.getenv("LLM_LEDGER_MAX_BYTES", str(10 * 1024 * 1024)))
+LLM_LEDGER_BACKUPS = int(os.getenv("LLM_LEDGER_BACKUPS", "5"))
+
+LATENCY_BUCKETS = [0.25, 0.5, 1, 2, 4, 8, 16, 32, 64]
+TOKEN_BUCKETS = [100, 250, 500, 750, 1000, 1500, 2000, 3000, 4000]
+
+_lock = threading.Lock()
+_aggregates = {}
+
+
+# =====================================================
+# JSONL WRITER (ROTATING)
+# =====================================================
+
+_ledger_logger = logging.getLogger("gradhire.llm_ledger")
+_ledger_logger.propagate = False
+_ledger_logger.setLevel(logging.INFO)
+
+try:
+
+    _handler = RotatingFileHandler(
+        LLM_LEDGER_PATH,
+        maxBytes=LLM_LEDGER_MAX_BYTES,
+        backupCount=LLM_LEDGER_BACKUPS,
+        delay=True
+    )
+
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+
+    _ledger_logger.addHandler(_handler)
+
+except Exception as e:
+
+    logging.warning(f"LLM ledger file disabled: {e}")
+
+
+# =====================================================
+# HISTOGRAM
+# =====================================================
+
+class Histogram:
+
+    def __init__(self, buckets):
+
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0
+        self.sum = 0.0
+
+
+    def observe(self, value):
+
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += 1
+        self.sum += value
+
+
+    def snapshot(self):
+
+        labels = [str(b) for b in self.buckets] + ["+Inf"]
+
+        return {
+            "count": self.total,
+            "sum": round(self.sum, 4),
+            "mean": round(self.sum / self.total, 4) if self.total else 0,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+def _new_aggregate():
+
+    return {
+        "calls": 0,
+        "cache_hits": 0,
+        "attempts": 0,
+        "parse_failures": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "latency_seconds": Histogram(LATENCY_BUCKETS),
+        "prompt_tokens_hist": Histogram(TOKEN_BUCKETS),
+        "completion_tokens_hist": Histogram(TOKEN_BUCKETS),
+    }
+
+
+# =====================================================
+# RECORD
+# =====================================================
+
+def record(
+    endpoint: str,
+    model: str,
+    attempts: int,
+    prompt_tokens: int,
+    completion_tokens: int,
+    latency: float,
+    parse_ok: bool,
+    cached: bool = False
+):
+
+    entry = {
+        "ts": round(time.time(), 3),
+        "endpoint": endpoint,
+        "model": model,
+        "attempts": attempts,
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "latency": round(latency, 4),
+        "parse_ok": parse_ok,
+        "cached": cached,
+    }
+
+    with _lock:
+
+        agg = _aggregates.setdefault((endpoint, model), _new_aggregate())
+
+        agg["calls"] += 1
+
+        if cached:
+
+            agg["cache_hits"] += 1
+
+        else:
+
+            agg["attempts"] += attempts
+            agg["prompt_tokens"] += prompt_tokens
+            agg["completion_tokens"] += completion_tokens
+
+            agg["latency_seconds"].observe(latency)
+            agg["prompt_tokens_hist"].observe(prompt_tokens)
+            agg["completion_tokens_hist"].observe(completion_tokens)
+
+        if not parse_ok:
+            agg["parse_failures"] += 1
+
+    try:
+        _ledger_logger.info(json.dumps(entry))
+    except Exception as e:
+        logging.warning(f"LLM ledger write failed: {e}")
+
+
+# =====================================================
+# QUERY
+# =====================================================
+
+def snapshot():
+
+    result = []
+
+    with _lock:
+
+        for (endpoint, model), agg in _aggregates.items():
+
+            row = {"endpoint": endpoint, "model": model}
+
+            for name, value in agg.items():
+                row[name] = (
+                    value.snapshot()
+                    if isinstance(value, Histogram)
+                    else value
+                )
+
+            result.append(row)
+
+    return result
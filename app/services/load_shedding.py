@@ -0,0 +1,300 @@
+import os
+import json
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from urllib.parse import parse_qs
+
+from fastapi import HTTPException
+
+from app.services import metrics
+
+
+# =====================================================
+# GradHire Load Shedding
+# Per-route concurrency limits grouped by cost class.
+# Each class admits N requests, queues a few more for a
+# short time, and rejects the rest with a fast 503
+# =====================================================
+
+def _limit(cost_class, concurrency, queue, retry_after):
+
+    prefix = cost_class.upper()
+
+    return {
+        "concurrency": int(os.getenv(f"{prefix}_CONCURRENCY", str(concurrency))),
+        "queue": int(os.getenv(f"{prefix}_QUEUE", str(queue))),
+        "retry_after": int(os.getenv(f"{prefix}_RETRY_AFTER", str(retry_after))),
+    }
+
+
+# Limits are per worker process
+COST_CLASSES = {
+    "llm": _limit("llm", concurrency=8, queue=8, retry_after=5),
+    "pdf": _limit("pdf", concurrency=4, queue=8, retry_after=2),
+    "search": _limit("search", concurrency=8, queue=16, retry_after=3),
+    "local": _limit("local", concurrency=32, queue=32, retry_after=1),
+}
+
+# LLM calls one /resume/optimize/batch request runs at once
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "4"))
+
+# Batches get their own class, sized so that a full one runs about as
+# many LLM calls as a full llm class
+COST_CLASSES["llm_batch"] = _limit(
+    "llm_batch",
+    concurrency=max(1, COST_CLASSES["llm"]["concurrency"] // max(1, BATCH_CONCURRENCY)),
+    queue=4,
+    retry_after=5
+)
+
+# Max time a request may wait in a class queue before it is shed
+QUEUE_TIMEOUT = float(os.getenv("LOAD_SHED_QUEUE_TIMEOUT", "2"))
+
+# (method, path) -> cost class; unlisted routes are never limited.
+# /resume/download takes its slot in the handler ("pdf" when rendering a
+# stored optimization_id, "llm" when optimizing an upload): the choice
+# depends on a form field
+ROUTE_CLASSES = {
+    ("POST", "/resume/optimize"): "llm",
+    ("POST", "/resume/optimize/stream"): "llm",
+    ("POST", "/resume/optimize/batch"): "llm_batch",
+    ("POST", "/resume/upload"): "pdf",
+    ("POST", "/resume/render/batch"): "pdf",
+    ("POST", "/jobs/from-resume"): "search",
+}
+
+# (method, path, mode query param) -> cost class, checked first. Fast mode
+# answers locally; it must not wait behind (or be shed with) LLM requests
+MODE_CLASSES = {
+    ("POST", "/resume/optimize", "fast"): "local",
+}
+
+MODE_PATHS = {(method, path) for method, path, _ in MODE_CLASSES}
+
+IN_FLIGHT = metrics.Gauge(
+    "gradhire_load_shed_in_flight",
+    "Admitted requests currently running, by cost class.",
+    ["cost_class"]
+)
+
+QUEUED = metrics.Gauge(
+    "gradhire_load_shed_queued",
+    "Requests waiting for a slot, by cost class.",
+    ["cost_class"]
+)
+
+SHED = metrics.Counter(
+    "gradhire_load_shed_rejected_total",
+    "Requests rejected with 503, by cost class and reason.",
+    ["cost_class", "reason"]
+)
+
+
+class Overloaded(Exception):
+    pass
+
+
+# =====================================================
+# LIMITER (EVENT-LOOP LOCAL, FIFO HAND-OFF)
+# =====================================================
+
+class ConcurrencyLimit:
+
+    def __init__(self, name, concurrency, queue, retry_after):
+
+        self.name = name
+        self.concurrency = concurrency
+        self.max_queue = queue
+        self.retry_after = retry_after
+
+        self.active = 0
+        self._waiters = deque()
+
+
+    async def acquire(self, timeout=QUEUE_TIMEOUT):
+
+        if self.active < self.concurrency and not self._waiters:
+            self.active += 1
+            IN_FLIGHT.inc(cost_class=self.name)
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            SHED.inc(cost_class=self.name, reason="queue_full")
+            raise Overloaded(self.name)
+
+        waiter = asyncio.get_running_loop().create_future()
+
+        self._waiters.append(waiter)
+        QUEUED.inc(cost_class=self.name)
+
+        try:
+            await asyncio.wait_for(waiter, timeout)
+
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we gave up
+                self.release()
+
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+            if isinstance(e, asyncio.TimeoutError):
+                SHED.inc(cost_class=self.name, reason="queue_timeout")
+                raise Overloaded(self.name)
+
+            raise
+
+        finally:
+            QUEUED.dec(cost_class=self.name)
+
+
+    def try_acquire(self) -> bool:
+
+        # Never queues: for optional work that should give way to requests
+        if self.active < self.concurrency and not self._waiters:
+            self.active += 1
+            IN_FLIGHT.inc(cost_class=self.name)
+            return True
+
+        SHED.inc(cost_class=self.name, reason="busy")
+        return False
+
+
+    def release(self):
+
+        # Hand the slot straight to the oldest live waiter
+        while self._waiters:
+
+            waiter = self._waiters.popleft()
+
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self.active -= 1
+        IN_FLIGHT.dec(cost_class=self.name)
+
+
+LIMITS = {
+    name: ConcurrencyLimit(name, **config)
+    for name, config in COST_CLASSES.items()
+}
+
+
+@asynccontextmanager
+async def slot(cost_class):
+
+    # For handlers that only know their cost class after reading the body
+    limit = LIMITS[cost_class]
+
+    try:
+        await limit.acquire()
+    except Overloaded:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Server busy ({limit.name}), please retry",
+            headers={"Retry-After": str(limit.retry_after)}
+        )
+
+    try:
+        yield
+    finally:
+        limit.release()
+
+
+# =====================================================
+# ASGI MIDDLEWARE
+# =====================================================
+
+def classify(scope):
+
+    route = (scope.get("method"), scope.get("path"))
+
+    if route in MODE_PATHS:
+
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+
+        mode = query.get("mode", [None])[0]
+
+        if (*route, mode) in MODE_CLASSES:
+            return MODE_CLASSES[(*route, mode)]
+
+    return ROUTE_CLASSES.get(route)
+
+
+class LoadSheddingMiddleware:
+
+    def __init__(self, app):
+
+        self.app = app
+
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        cost_class = classify(scope)
+
+        limit = LIMITS.get(cost_class)
+
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await limit.acquire()
+
+        except Overloaded:
+            # Lets the metrics middleware label the request by its path
+            scope["load_shed"] = cost_class
+            await _reject(send, limit)
+            return
+
+        released = False
+
+        def release():
+
+            nonlocal released
+
+            if not released:
+                released = True
+                limit.release()
+
+        # The slot is held until the last body message is sent, so streamed
+        # responses count in full. Background tasks run after that point
+        # (still inside the app call) and do not hold the slot
+        async def send_wrapper(message):
+
+            await send(message)
+
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                release()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+
+        finally:
+            release()
+
+
+async def _reject(send, limit):
+
+    body = json.dumps({
+        "detail": f"Server busy ({limit.name}), please retry"
+    }).encode("utf-8")
+
+    await send({
+        "type": "http.response.start",
+        "status": 503,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+            (b"retry-after", str(limit.retry_after).encode("latin-1")),
+        ],
+    })
+
+    await send({"type": "http.response.body", "body": body})
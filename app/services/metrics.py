@@ -0,0 +1,337 @@
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+
+
+# =====================================================
+# GradHire Metrics
+# Minimal Prometheus-style counters / gauges / histograms
+# rendered in the text exposition format
+# =====================================================
+
+DEFAULT_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60
+)
+
+REGISTRY = []
+
+
+def _format_labels(labelnames, key, extra=None):
+
+    pairs = list(zip(labelnames, key))
+
+    if extra:
+        pairs.append(extra)
+
+    if not pairs:
+        return ""
+
+    body = ",".join(
+        '{}="{}"'.format(
+            name,
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for name, value in pairs
+    )
+
+    return "{" + body + "}"
+
+
+def _format_value(value):
+
+    if value == float("inf"):
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+
+    kind = "untyped"
+
+    def __init__(self, name, documentation, labelnames=()):
+
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+        self._lock = threading.Lock()
+        self._values = {}
+
+        REGISTRY.append(self)
+
+
+    def _key(self, labels):
+
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+
+    def render(self):
+
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+        with self._lock:
+            items = list(self._values.items())
+
+        for key, value in items:
+            lines.append(
+                f"{self.name}{_format_labels(self.labelnames, key)} "
+                f"{_format_value(value)}"
+            )
+
+        return lines
+
+
+class Counter(_Metric):
+
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+
+        key = self._key(labels)
+
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+
+    kind = "gauge"
+
+    def inc(self, amount=1, **labels):
+
+        key = self._key(labels)
+
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+    def dec(self, amount=1, **labels):
+
+        self.inc(-amount, **labels)
+
+
+    def set(self, value, **labels):
+
+        key = self._key(labels)
+
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+
+        super().__init__(name, documentation, labelnames)
+
+        self.buckets = tuple(buckets)
+
+
+    def observe(self, value, **labels):
+
+        key = self._key(labels)
+
+        index = bisect.bisect_left(self.buckets, value)
+
+        with self._lock:
+
+            state = self._values.get(key)
+
+            if state is None:
+                # [per-bucket counts..., +Inf count], sum
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+
+            state[0][index] += 1
+            state[1] += value
+
+
+    @contextmanager
+    def time(self, **labels):
+
+        started = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+
+    def render(self):
+
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+        with self._lock:
+            items = [
+                (key, list(counts), total)
+                for key, (counts, total) in self._values.items()
+            ]
+
+        for key, counts, total in items:
+
+            cumulative = 0
+
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+
+                cumulative += count
+
+                labels = _format_labels(
+                    self.labelnames, key, ("le", _format_value(bound))
+                )
+
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+
+            labels = _format_labels(self.labelnames, key)
+
+            lines.append(f"{self.name}_sum{labels} {total!r}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+
+        return lines
+
+
+def render() -> str:
+
+    lines = []
+
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+
+    return "\n".join(lines) + "\n"
+
+
+# =====================================================
+# APPLICATION METRICS
+# =====================================================
+
+STAGE_DURATION = Histogram(
+    "gradhire_stage_duration_seconds",
+    "Time spent in each request processing stage.",
+    ["stage"]
+)
+
+STAGE_IN_FLIGHT = Gauge(
+    "gradhire_stage_in_flight",
+    "Stage executions currently running.",
+    ["stage"]
+)
+
+STAGE_ERRORS = Counter(
+    "gradhire_stage_errors_total",
+    "Stage executions that raised.",
+    ["stage"]
+)
+
+UPSTREAM_ERRORS = Counter(
+    "gradhire_upstream_errors_total",
+    "Failed calls to upstream services.",
+    ["upstream"]
+)
+
+HTTP_REQUESTS = Counter(
+    "gradhire_http_requests_total",
+    "HTTP requests by route and status.",
+    ["method", "route", "status"]
+)
+
+HTTP_DURATION = Histogram(
+    "gradhire_http_request_duration_seconds",
+    "HTTP request latency (until the response starts) by route.",
+    ["method", "route"]
+)
+
+HTTP_IN_FLIGHT = Gauge(
+    "gradhire_http_requests_in_flight",
+    "HTTP requests currently being handled."
+)
+
+
+@contextmanager
+def stage(name):
+
+    STAGE_IN_FLIGHT.inc(stage=name)
+
+    started = time.perf_counter()
+
+    try:
+        yield
+
+    except BaseException:
+        STAGE_ERRORS.inc(stage=name)
+        raise
+
+    finally:
+        STAGE_DURATION.observe(time.perf_counter() - started, stage=name)
+        STAGE_IN_FLIGHT.dec(stage=name)
+
+
+# =====================================================
+# ASGI MIDDLEWARE
+# =====================================================
+
+class MetricsMiddleware:
+
+    def __init__(self, app):
+
+        self.app = app
+
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "")
+
+        status = {"code": 500}
+        started = time.perf_counter()
+
+        HTTP_IN_FLIGHT.inc()
+
+        async def send_wrapper(message):
+
+            if message["type"] == "http.response.start":
+
+                status["code"] = message["status"]
+
+                HTTP_DURATION.observe(
+                    time.perf_counter() - started,
+                    method=method,
+                    route=_route_template(scope)
+                )
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+
+        finally:
+
+            HTTP_IN_FLIGHT.dec()
+
+            HTTP_REQUESTS.inc(
+                method=method,
+                route=_route_template(scope),
+                status=status["code"]
+            )
+
+
+def _route_template(scope):
+
+    # Use the matched route pattern so path params do not explode cardinality
+    route = scope.get("route")
+
+    if route is None and "load_shed" in scope:
+        # Shed before routing; only fixed, rate-limited paths are shed
+        return scope["path"]
+
+    return getattr(route, "path", None) or "unmatched"
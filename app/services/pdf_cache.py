@@ -0,0 +1,77 @@
+import os
+import json
+import hashlib
+
+from app.services.cache import TieredCache
+from app.services.pdf_output import buffer_size
+
+
+# =====================================================
+# GradHire Rendered PDF Cache
+# "pdf" namespace of the tiered cache, keyed by
+# canonicalized resume_data + layout version
+# =====================================================
+
+PDF_CACHE_MAX_BYTES = int(os.getenv("PDF_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+PDF_CACHE_LOCAL_BYTES = int(os.getenv("PDF_CACHE_LOCAL_BYTES", str(16 * 1024 * 1024)))
+PDF_CACHE_MAX_ITEM_BYTES = int(os.getenv("PDF_CACHE_MAX_ITEM_BYTES", str(1024 * 1024)))
+PDF_CACHE_TTL = int(os.getenv("PDF_CACHE_TTL", str(24 * 60 * 60)))
+
+_cache = TieredCache(
+    "pdf",
+    ttl=PDF_CACHE_TTL,
+    local_max_bytes=PDF_CACHE_LOCAL_BYTES,
+    shared_max_bytes=PDF_CACHE_MAX_BYTES,
+    max_item_bytes=PDF_CACHE_MAX_ITEM_BYTES,
+    codec="bytes"
+)
+
+
+# =====================================================
+# KEY
+# =====================================================
+
+def make_key(resume_data: dict, layout_version: str) -> str:
+
+    canonical = json.dumps(
+        resume_data,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str
+    )
+
+    return hashlib.sha256(
+        f"{layout_version}\n{canonical}".encode("utf-8")
+    ).hexdigest()
+
+
+# =====================================================
+# GET / PUT
+# =====================================================
+
+def get(key: str):
+
+    return _cache.get(key)
+
+
+def put(key: str, data: bytes):
+
+    _cache.put(key, data)
+
+
+# =====================================================
+# STORE A RENDERED BUFFER
+# =====================================================
+
+def store_buffer(key: str, buffer):
+
+    if buffer_size(buffer) > PDF_CACHE_MAX_ITEM_BYTES:
+        return
+
+    position = buffer.tell()
+
+    buffer.seek(0)
+    put(key, buffer.read())
+
+    buffer.seek(position)
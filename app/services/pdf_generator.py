@@ -1,6 +1,5 @@
 # app/services/pdf_generator.py
 
-import uuid
 from reportlab.platypus import (
     SimpleDocTemplate,
     Paragraph,
@@ -11,8 +10,10 @@ from reportlab.platypus import (
 from reportlab.lib.pagesizes import LETTER
 from reportlab.lib.styles import ParagraphStyle
 
+from app.services.pdf_output import new_pdf_buffer
 
-def generate_resume_pdf(resume_data: dict, output_path: str | None = None):
+
+def generate_resume_pdf(resume_data: dict, output=None):
     """
     Production-ready FAANG resume PDF generator.
 
@@ -51,8 +52,9 @@ def generate_resume_pdf(resume_data: dict, output_path: str | None = None):
     }
     """
 
-    if not output_path:
-        output_path = f"/tmp/resume_{uuid.uuid4().hex}.pdf"
+    # Path or binary file object; defaults to an in-memory buffer
+    if output is None:
+        output = new_pdf_buffer()
 
     # =====================
     # Styles
@@ -100,7 +102,7 @@ def generate_resume_pdf(resume_data: dict, output_path: str | None = None):
     # =====================
 
     doc = SimpleDocTemplate(
-        output_path,
+        output,
         pagesize=LETTER,
         leftMargin=50,
         rightMargin=50,
@@ -248,4 +250,7 @@ def generate_resume_pdf(resume_data: dict, output_path: str | None = None):
 
     doc.build(elements)
 
-    return output_path
+    if hasattr(output, "seek"):
+        output.seek(0)
+
+    return output
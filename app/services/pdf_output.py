@@ -0,0 +1,50 @@
+import os
+import tempfile
+
+
+# =====================================================
+# GradHire PDF Output Buffers
+# In memory by default, spilled to an anonymous temp file
+# for unusually large documents (deleted on close)
+# =====================================================
+
+PDF_SPOOL_MAX_BYTES = int(os.getenv("PDF_SPOOL_MAX_BYTES", str(2 * 1024 * 1024)))
+
+CHUNK_SIZE = 64 * 1024
+
+
+def new_pdf_buffer():
+
+    return tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_BYTES, mode="w+b")
+
+
+def buffer_size(buffer) -> int:
+
+    position = buffer.tell()
+
+    buffer.seek(0, os.SEEK_END)
+    size = buffer.tell()
+
+    buffer.seek(position)
+
+    return size
+
+
+def iter_and_close(buffer, chunk_size=CHUNK_SIZE):
+
+    # Closing a spooled file removes its on-disk copy, if any
+    try:
+
+        buffer.seek(0)
+
+        while True:
+
+            chunk = buffer.read(chunk_size)
+
+            if not chunk:
+                break
+
+            yield chunk
+
+    finally:
+        buffer.close()
@@ -0,0 +1,212 @@
+import os
+import sys
+import time
+import uuid
+import random
+import logging
+import threading
+from collections import Counter
+
+from starlette.concurrency import run_in_threadpool
+
+
+# =====================================================
+# GradHire Request Profiler
+# Low-overhead stack sampler for a sample of requests,
+# written as folded stacks (flamegraph.pl / speedscope).
+# Every thread of the process is sampled (event loop,
+# threadpool, render pool), so work of other requests
+# running at the same time shows up in the profile too
+# =====================================================
+
+PROFILE_DIR = os.getenv("PROFILE_DIR", "/tmp/gradhire_profiles")
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL", "0.005"))
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "20"))
+
+# Requests carrying this header value are always profiled
+PROFILE_HEADER = b"x-debug-profile"
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN", "")
+
+MAX_STACK_DEPTH = 64
+
+# Only one request is profiled at a time to keep overhead bounded
+_active = threading.Lock()
+
+
+# =====================================================
+# SAMPLER
+# =====================================================
+
+class StackSampler:
+
+    def __init__(self, interval=PROFILE_INTERVAL):
+
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="gradhire-profiler",
+            daemon=True
+        )
+
+
+    def start(self):
+
+        self.started = time.perf_counter()
+        self._thread.start()
+
+
+    def stop(self):
+
+        self._stop.set()
+        self._thread.join()
+
+        self.duration = time.perf_counter() - self.started
+
+
+    def _run(self):
+
+        own = threading.get_ident()
+
+        while not self._stop.wait(self.interval):
+
+            for ident, frame in sys._current_frames().items():
+
+                if ident == own:
+                    continue
+
+                self.stacks[_folded(frame)] += 1
+
+            self.samples += 1
+
+
+def _folded(frame):
+
+    parts = []
+
+    while frame is not None and len(parts) < MAX_STACK_DEPTH:
+
+        code = frame.f_code
+
+        parts.append(
+            f"{code.co_name} "
+            f"({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        )
+
+        frame = frame.f_back
+
+    return ";".join(reversed(parts))
+
+
+# =====================================================
+# OUTPUT (BOUNDED RETENTION)
+# =====================================================
+
+def _slug(route):
+
+    slug = "".join(c if c.isalnum() else "_" for c in route.strip("/"))
+
+    return slug or "root"
+
+
+def write_profile(route, method, sampler):
+
+    directory = os.path.join(PROFILE_DIR, _slug(route))
+
+    os.makedirs(directory, exist_ok=True)
+
+    path = os.path.join(
+        directory,
+        f"{time.strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:6]}_"
+        f"{method}_{int(sampler.duration * 1000)}ms.folded"
+    )
+
+    with open(path, "w") as f:
+
+        f.write(
+            f"# route={route} method={method} "
+            f"duration={sampler.duration:.4f}s samples={sampler.samples} "
+            f"interval={sampler.interval}s\n"
+        )
+
+        for stack, count in sampler.stacks.most_common():
+            f.write(f"{stack} {count}\n")
+
+    files = sorted(
+        (os.path.join(directory, name) for name in os.listdir(directory)),
+        key=os.path.getmtime
+    )
+
+    for old in files[:-PROFILE_MAX_FILES]:
+        os.remove(old)
+
+    return path
+
+
+# =====================================================
+# ASGI MIDDLEWARE
+# =====================================================
+
+def should_profile(scope):
+
+    if PROFILE_TOKEN:
+
+        for name, value in scope.get("headers", []):
+
+            if name == PROFILE_HEADER and value.decode("latin-1") == PROFILE_TOKEN:
+                return True
+
+    return PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+
+
+def finish_profile(sampler, route, method):
+
+    # Joins the sampler thread and touches the filesystem: run off the loop
+    try:
+        sampler.stop()
+    finally:
+        _active.release()
+
+    try:
+        write_profile(route, method, sampler)
+    except Exception as e:
+        logging.warning(f"Profile write failed: {e}")
+
+
+class ProfilingMiddleware:
+
+    def __init__(self, app):
+
+        self.app = app
+
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http" or not should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if not _active.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+
+        sampler = StackSampler()
+        sampler.start()
+
+        try:
+            await self.app(scope, receive, send)
+
+        finally:
+
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+
+            await run_in_threadpool(
+                finish_profile,
+                sampler,
+                route,
+                scope.get("method", "")
+            )
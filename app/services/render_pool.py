@@ -0,0 +1,139 @@
+import os
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services import metrics
+
+
+# =====================================================
+# GradHire Render Pool
+# Bounded worker pool for CPU-bound PDF rendering so it
+# never runs on (or starves) the event loop
+# =====================================================
+
+RENDER_WORKERS = int(os.getenv("RENDER_WORKERS", "2"))
+RENDER_MAX_QUEUE = int(os.getenv("RENDER_MAX_QUEUE", "16"))
+RENDER_RETRY_AFTER = 2
+
+QUEUE_DEPTH = metrics.Gauge(
+    "gradhire_render_pool_queue_depth",
+    "Render jobs waiting for a worker."
+)
+
+ACTIVE = metrics.Gauge(
+    "gradhire_render_pool_active",
+    "Render jobs currently running."
+)
+
+REJECTED = metrics.Counter(
+    "gradhire_render_pool_rejected_total",
+    "Render jobs rejected because the queue was full."
+)
+
+WAIT_SECONDS = metrics.Histogram(
+    "gradhire_render_pool_wait_seconds",
+    "Time render jobs spent queued before starting."
+)
+
+
+class RenderPoolBusy(Exception):
+    pass
+
+
+_executor = ThreadPoolExecutor(
+    max_workers=RENDER_WORKERS,
+    thread_name_prefix="gradhire-render"
+)
+
+_lock = threading.Lock()
+_pending = 0
+
+
+def _acquire_slot():
+
+    global _pending
+
+    with _lock:
+
+        # Backpressure: running + queued jobs are bounded
+        if _pending >= RENDER_WORKERS + RENDER_MAX_QUEUE:
+            return False
+
+        _pending += 1
+
+    return True
+
+
+def _release_slot():
+
+    global _pending
+
+    with _lock:
+        _pending -= 1
+
+
+def _run(fn, args, queued_at):
+
+    QUEUE_DEPTH.dec()
+    ACTIVE.inc()
+
+    WAIT_SECONDS.observe(time.perf_counter() - queued_at)
+
+    try:
+        return fn(*args)
+    finally:
+        ACTIVE.dec()
+
+
+async def submit(fn, *args):
+    """
+    Run `fn(*args)` on the render pool. Raises RenderPoolBusy
+    immediately when the queue is full.
+    """
+
+    if not _acquire_slot():
+        REJECTED.inc()
+        raise RenderPoolBusy()
+
+    QUEUE_DEPTH.inc()
+
+    future = _executor.submit(_run, fn, args, time.perf_counter())
+
+    # Released when the job finishes (or is cancelled before starting),
+    # not when the awaiting request goes away
+    future.add_done_callback(_on_done)
+
+    return await asyncio.wrap_future(future)
+
+
+def run_blocking(fn, *args):
+    """
+    Run `fn(*args)` on the render pool from a worker thread (background
+    tasks) and wait for the result. Never rejected: each caller blocks
+    its own thread, so the extra queueing is bounded by the number of
+    such threads (TASK_WORKERS). It still counts toward the backpressure
+    limit seen by requests.
+    """
+
+    global _pending
+
+    with _lock:
+        _pending += 1
+
+    QUEUE_DEPTH.inc()
+
+    future = _executor.submit(_run, fn, args, time.perf_counter())
+
+    future.add_done_callback(_on_done)
+
+    return future.result()
+
+
+def _on_done(future):
+
+    if future.cancelled():
+        QUEUE_DEPTH.dec()
+
+    _release_slot()
@@ -1,6 +1,8 @@
-import uuid
+from functools import lru_cache
 from reportlab.lib.pagesizes import LETTER
-from reportlab.pdfgen import canvas
+
+from app.services import metrics
+from app.services.pdf_output import new_pdf_buffer
 
 
 # =====================================================
@@ -9,6 +11,9 @@ from reportlab.pdfgen import canvas
 # One-page optimized
 # =====================================================
 
+# Bump whenever the drawn layout changes (invalidates cached PDFs)
+LAYOUT_VERSION = "1"
+
 MAX_BULLETS_PER_ROLE = 4
 MAX_PROJECTS = 2
 MAX_EXPERIENCE = 3
@@ -23,12 +28,71 @@ LINE_SPACING = 14
 SECTION_SPACING = 18
 ITEM_SPACING = 10
 
+WORD_WIDTH_CACHE_SIZE = 8192
+
+
+# =====================================================
+# TEXT LAYOUT (LINEAR-TIME WRAPPING)
+# =====================================================
+
+@lru_cache(maxsize=WORD_WIDTH_CACHE_SIZE)
+def word_units(word: str, font: str = FONT) -> float:
+
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    # Width in 1/1000 em. Glyph metrics of the standard fonts are
+    # integers, so sums are exact and reusable for every font size.
+    return round(stringWidth(word, font, 1000), 3)
+
+
+def wrap_text(text, max_width, font=FONT, size=10):
+
+    if not text:
+        return []
+
+    words = str(text).split()
+
+    # Standard Type 1 fonts have no kerning: a line's width is the
+    # sum of its word widths plus its spaces
+    space = word_units(" ", font)
+
+    lines = []
+    current = []
+    current_units = 0.0
+
+    for word in words:
+
+        units = word_units(word, font)
+
+        candidate = current_units + space + units if current else units
+
+        # Same arithmetic as reportlab's stringWidth for the full line
+        if candidate * 0.001 * size <= max_width:
+            current.append(word)
+            current_units = candidate
+        else:
+            if current:
+                lines.append(" ".join(current))
+            current = [word]
+            current_units = units
 
-def build_resume_pdf(data: dict) -> str:
+    if current:
+        lines.append(" ".join(current))
 
-    filename = f"/tmp/resume_{uuid.uuid4().hex}.pdf"
+    return lines
 
-    c = canvas.Canvas(filename, pagesize=LETTER)
+
+@metrics.stage("build_resume_pdf")
+def build_resume_pdf(data: dict, output=None):
+
+    # reportlab's canvas is imported on first render (see warmup)
+    from reportlab.pdfgen import canvas
+
+    # Rendered into memory (spills to a temp file only if very large)
+    if output is None:
+        output = new_pdf_buffer()
+
+    c = canvas.Canvas(output, pagesize=LETTER)
 
     y = PAGE_HEIGHT - MARGIN
 
@@ -51,35 +115,6 @@ def build_resume_pdf(data: dict) -> str:
         c.drawRightString(PAGE_WIDTH - MARGIN, y_pos, str(text))
 
 
-    def wrap_text(text, max_width, font=FONT, size=10):
-
-        if not text:
-            return []
-
-        words = str(text).split()
-
-        lines = []
-        current = ""
-
-        for word in words:
-
-            test = f"{current} {word}".strip()
-
-            width = c.stringWidth(test, font, size)
-
-            if width <= max_width:
-                current = test
-            else:
-                if current:
-                    lines.append(current)
-                current = word
-
-        if current:
-            lines.append(current)
-
-        return lines
-
-
     def draw_paragraph(text, indent=0):
 
         nonlocal y
@@ -303,4 +338,6 @@ def build_resume_pdf(data: dict) -> str:
 
     c.save()
 
-    return filename
+    output.seek(0)
+
+    return output
@@ -0,0 +1,532 @@
+import re
+from typing import Dict, List
+
+from app.services.skills import extract_skills
+
+
+# =====================================================
+# GradHire Local Resume Parser
+# Deterministic extraction of header, sections,
+# education and experience entries (no LLM)
+# =====================================================
+
+SECTION_ALIASES = {
+
+    "summary": [
+        "summary", "professional summary", "profile", "objective",
+        "career objective", "about me",
+    ],
+
+    "experience": [
+        "experience", "work experience", "professional experience",
+        "employment", "internships", "internship", "internship experience",
+    ],
+
+    "projects": [
+        "projects", "academic projects", "personal projects",
+        "key projects", "project experience",
+    ],
+
+    "education": [
+        "education", "academic background", "academics",
+        "educational qualifications",
+    ],
+
+    "skills": [
+        "skills", "technical skills", "core skills", "tech stack",
+        "technologies",
+    ],
+
+    "other": [
+        "certifications", "achievements", "awards", "activities",
+        "extracurricular activities", "publications", "languages",
+        "interests", "hobbies", "positions of responsibility",
+        "leadership", "courses", "coursework", "relevant coursework",
+    ],
+}
+
+HEADING_TO_SECTION = {
+    alias: section
+    for section, aliases in SECTION_ALIASES.items()
+    for alias in aliases
+}
+
+BULLET_CHARS = "•●▪◦‣∙·○■□◆◇►▸➢➤✓✔❖-–*"
+
+# pdfminer emits glyphs it cannot map to unicode as "(cid:NNN)" (reportlab's
+# own "•" comes out as "(cid:127)"); symbol fonts use the private use area
+BULLET_RE = re.compile(
+    rf"^(?:\(cid:\d+\)|[{re.escape(BULLET_CHARS)}]|[\ue000-\uf8ff])\s*"
+)
+
+# A line at least this close to the widest line of its section filled the
+# text width, so the line after it is a wrapped continuation
+WRAP_RATIO = 0.85
+
+# Longer unmarked lines under an entry header are bullets, not headers
+HEADER_MAX_WORDS = 8
+
+FIELD_STRIP = " ,|-–—"
+
+MONTH = (
+    r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+)
+
+DATE = rf"(?:{MONTH}\s*'?\d{{2,4}}|\d{{1,2}}/\d{{2,4}}|\d{{4}})"
+
+DATE_RANGE_RE = re.compile(
+    rf"{DATE}\s*(?:-|–|—|to)\s*(?:{DATE}|present|current|now|ongoing)"
+    rf"|{DATE}",
+    re.IGNORECASE
+)
+
+FIELD_SPLIT_RE = re.compile(r"\s*(?:\||\s[-–—]\s|\s{2,}|\bat\b)\s*")
+
+# Explicit separators between header segments ("—", "|", " / ", wide gaps)
+SEGMENT_SPLIT_RE = re.compile(r"\s*\|\s*|\s+[-–—/]\s+|\s{2,}")
+
+# Matched against a whole segment only: "Title, Company" has the same shape
+LOCATION_RE = re.compile(
+    r"[A-Z][a-zA-Z.]+(?: [A-Z][a-zA-Z.]+)*,\s*[A-Z][a-zA-Z.]+(?: [A-Z][a-zA-Z.]+)*"
+)
+
+TITLE_RE = re.compile(
+    r"\b(engineer|developer|intern|analyst|scientist|researcher|designer|"
+    r"architect|consultant|manager|assistant|associate|trainee|fellow|lead)\b",
+    re.IGNORECASE
+)
+
+EMPTY_BRACKETS_RE = re.compile(r"\(\s*\)|\[\s*\]")
+
+PHONE_RE = re.compile(r"\+?\(?\d[\d\s().-]{8,}\d")
+
+PHONE_MIN_DIGITS = 10
+PHONE_MAX_DIGITS = 15
+
+NAME_PLACEHOLDER = "Candidate Name"
+
+NAME_MAX_WORDS = 5
+
+YEAR_RANGE_RE = re.compile(r"^(?:19|20)\d{2}\s*[-–—]\s*(?:19|20)\d{2}$")
+
+DEGREE_RE = re.compile(
+    r"\b(b\.?\s?tech|m\.?\s?tech|b\.?\s?e\b|m\.?\s?e\b|b\.?\s?s\b|m\.?\s?s\b|"
+    r"b\.?\s?sc|m\.?\s?sc|bca|mca|mba|bachelor|master|ph\.?\s?d|diploma|"
+    r"associate|high school|higher secondary|class (?:x|xii|10|12))",
+    re.IGNORECASE
+)
+
+SCHOOL_RE = re.compile(
+    r"\b(university|college|institute|school|academy|iit|nit|iiit)\b",
+    re.IGNORECASE
+)
+
+
+# =====================================================
+# HEADER (NAME / CONTACT)
+# =====================================================
+
+def extract_phone(resume_text):
+
+    for match in PHONE_RE.finditer(resume_text):
+
+        candidate = match.group().strip()
+
+        digits = sum(char.isdigit() for char in candidate)
+
+        # Date ranges ("2019 - 2023") have the same characters as a phone
+        if (
+            PHONE_MIN_DIGITS <= digits <= PHONE_MAX_DIGITS
+            and not YEAR_RANGE_RE.match(candidate)
+        ):
+            return candidate
+
+    return ""
+
+
+def fallback_extract_contact(resume_text):
+
+    email = re.search(r'[\w\.-]+@[\w\.-]+', resume_text)
+    phone = extract_phone(resume_text)
+    linkedin = re.search(r'linkedin\.com\/\S+', resume_text)
+
+    parts = []
+
+    if email:
+        parts.append(email.group())
+
+    if phone:
+        parts.append(phone)
+
+    if linkedin:
+        parts.append(linkedin.group())
+
+    return " | ".join(parts)
+
+
+def looks_like_name(line: str) -> bool:
+
+    return (
+        1 < len(line) < 50
+        and len(line.split()) <= NAME_MAX_WORDS
+        and not is_bullet(line)
+        and not any(char.isdigit() for char in line)
+        and not any(mark in line for mark in "@|/:")
+        and section_for_heading(line) is None
+    )
+
+
+def fallback_extract_name(resume_text):
+
+    for line in resume_text.split("\n")[:5]:
+
+        line = line.strip()
+
+        # The name is part of the header, above the first section
+        if section_for_heading(line):
+            break
+
+        if looks_like_name(line):
+            return line
+
+    return NAME_PLACEHOLDER
+
+
+# =====================================================
+# SECTIONS
+# =====================================================
+
+def section_for_heading(line: str):
+
+    heading = re.sub(r"[^a-z ]", "", line.lower()).strip()
+
+    if not heading or len(heading) > 40:
+        return None
+
+    return HEADING_TO_SECTION.get(heading)
+
+
+def split_sections(resume_text: str) -> Dict[str, List[str]]:
+
+    sections = {"header": []}
+
+    current = "header"
+
+    for raw in resume_text.split("\n"):
+
+        line = raw.strip()
+
+        if not line:
+            continue
+
+        section = section_for_heading(line)
+
+        if section:
+            current = section
+            sections.setdefault(current, [])
+            continue
+
+        sections.setdefault(current, []).append(line)
+
+    return sections
+
+
+# =====================================================
+# LINE HELPERS
+# =====================================================
+
+def is_bullet(line: str) -> bool:
+
+    return bool(BULLET_RE.match(line))
+
+
+def strip_bullet(line: str) -> str:
+
+    return BULLET_RE.sub("", line, count=1).strip()
+
+
+def is_wrapped(line: str, widest: int) -> bool:
+
+    return bool(widest) and len(line) >= widest * WRAP_RATIO
+
+
+def has_date(line: str) -> bool:
+
+    return bool(DATE_RANGE_RE.search(line))
+
+
+def extract_duration(line: str):
+
+    match = DATE_RANGE_RE.search(line)
+
+    if not match:
+        return "", line
+
+    rest = line[:match.start()] + " " + line[match.end():]
+
+    # "Microsoft (Jan 2022 – Present)" leaves "()" behind
+    rest = EMPTY_BRACKETS_RE.sub("", rest).strip()
+
+    return match.group().strip(), rest
+
+
+def extract_location(line: str, whole_line: bool = False):
+    """
+    A location is only taken from the last segment after an explicit
+    separator, or (whole_line) from a line that is nothing but one.
+    """
+
+    line = line.strip(FIELD_STRIP)
+
+    separator = None
+
+    for separator in SEGMENT_SPLIT_RE.finditer(line):
+        pass
+
+    if separator is not None:
+        tail, rest = line[separator.end():], line[:separator.start()]
+    elif whole_line:
+        tail, rest = line, ""
+    else:
+        return "", line
+
+    tail = tail.strip(FIELD_STRIP)
+
+    if not LOCATION_RE.fullmatch(tail):
+        return "", line
+
+    return tail, rest.strip()
+
+
+def split_fields(line: str) -> List[str]:
+
+    return [
+        part.strip(FIELD_STRIP)
+        for part in FIELD_SPLIT_RE.split(line)
+        if part.strip(FIELD_STRIP)
+    ]
+
+
+# =====================================================
+# ENTRIES (EXPERIENCE / PROJECTS)
+# =====================================================
+
+def group_entries(lines: List[str]) -> List[dict]:
+    """
+    Group section lines into entries: one or two header lines
+    followed by bullets. Wrapped bullet lines are re-joined.
+
+    Sections without bullet markers are split on dated header lines,
+    and the lines after the header are taken as bullets.
+    """
+
+    marked = any(is_bullet(line) for line in lines)
+
+    widest = max((len(line) for line in lines), default=0)
+
+    entries = []
+
+    current = None
+    previous = ""
+
+    for line in lines:
+
+        if is_bullet(line):
+
+            if current is None:
+                current = {"header": [], "bullets": []}
+                entries.append(current)
+
+            current["bullets"].append(strip_bullet(line))
+
+        elif current is None:
+
+            current = {"header": [line], "bullets": []}
+            entries.append(current)
+
+        elif current["bullets"]:
+
+            dated = has_date(line)
+
+            # Without markers a capitalised line after a full one is
+            # more likely the next bullet than a wrapped continuation
+            continues = line[:1].islower() or (
+                is_wrapped(previous, widest)
+                and (marked or not line[:1].isupper())
+            )
+
+            if not dated and continues:
+
+                # Continuation of the previous bullet
+                current["bullets"][-1] += " " + line
+
+            elif dated or marked:
+
+                current = {"header": [line], "bullets": []}
+                entries.append(current)
+
+            else:
+                current["bullets"].append(line)
+
+        elif has_date(line) and any(has_date(header) for header in current["header"]):
+
+            # A second dated header: the previous entry had no bullets
+            current = {"header": [line], "bullets": []}
+            entries.append(current)
+
+        elif not marked and (
+            len(current["header"]) >= 2
+            or len(line.split()) > HEADER_MAX_WORDS
+        ):
+            current["bullets"].append(line)
+
+        else:
+            current["header"].append(line)
+
+        previous = line
+
+    return entries
+
+
+def parse_entry_header(header: List[str]) -> dict:
+
+    duration = ""
+    location = ""
+
+    fields = []
+
+    for i, line in enumerate(header):
+
+        if not duration:
+            found, line = extract_duration(line)
+            duration = found
+
+        if not location:
+            # A second header line may be just "City, Region"
+            found, line = extract_location(line, whole_line=i > 0)
+            location = found
+
+        fields.extend(split_fields(line))
+
+    # "Title, Company"
+    if len(fields) == 1 and ", " in fields[0]:
+        fields = [field.strip() for field in fields[0].split(", ", 1)]
+
+    # "Company — Title"
+    if (
+        len(fields) > 1
+        and TITLE_RE.search(fields[1])
+        and not TITLE_RE.search(fields[0])
+    ):
+        fields[0], fields[1] = fields[1], fields[0]
+
+    return {
+        "title": fields[0] if fields else "",
+        "company": fields[1] if len(fields) > 1 else "",
+        "duration": duration,
+        "location": location,
+    }
+
+
+def parse_experience(lines: List[str]) -> List[dict]:
+
+    experience = []
+
+    for entry in group_entries(lines):
+
+        parsed = parse_entry_header(entry["header"])
+        parsed["bullets"] = entry["bullets"]
+
+        experience.append(parsed)
+
+    return experience
+
+
+def parse_projects(lines: List[str]) -> List[dict]:
+
+    projects = []
+
+    for entry in group_entries(lines):
+
+        title = entry["header"][0] if entry["header"] else ""
+
+        _, title = extract_duration(title)
+
+        projects.append({
+            "title": split_fields(title)[0] if split_fields(title) else "",
+            "bullets": entry["bullets"],
+        })
+
+    return projects
+
+
+# =====================================================
+# EDUCATION
+# =====================================================
+
+def parse_education(lines: List[str]) -> List[dict]:
+
+    education = []
+
+    current = None
+
+    for line in lines:
+
+        if is_bullet(line):
+            continue
+
+        duration, rest = extract_duration(line)
+        location, rest = extract_location(rest)
+
+        is_degree = bool(DEGREE_RE.search(rest))
+        is_school = bool(SCHOOL_RE.search(rest))
+
+        starts_entry = current is None or (
+            (is_degree and current["degree"])
+            or (is_school and current["school"])
+        )
+
+        if starts_entry and (is_degree or is_school or current is None):
+            current = {"degree": "", "school": "", "duration": "", "location": ""}
+            education.append(current)
+
+        for field in split_fields(rest):
+
+            if DEGREE_RE.search(field) and not current["degree"]:
+                current["degree"] = field
+            elif SCHOOL_RE.search(field) and not current["school"]:
+                current["school"] = field
+
+        if duration and not current["duration"]:
+            current["duration"] = duration
+
+        if location and not current["location"]:
+            current["location"] = location
+
+    return [
+        edu for edu in education
+        if edu["degree"] or edu["school"]
+    ]
+
+
+# =====================================================
+# PUBLIC API
+# =====================================================
+
+def parse_resume(resume_text: str) -> dict:
+
+    if not resume_text:
+        resume_text = ""
+
+    sections = split_sections(resume_text)
+
+    return {
+        "name": fallback_extract_name(resume_text),
+        "contact": fallback_extract_contact(resume_text),
+        "summary": " ".join(sections.get("summary", [])),
+        "experience": parse_experience(sections.get("experience", [])),
+        "projects": parse_projects(sections.get("projects", [])),
+        "education": parse_education(sections.get("education", [])),
+        # Vocabulary terms found anywhere in the resume (keyword matching)
+        "skill_terms": extract_skills(resume_text),
+    }
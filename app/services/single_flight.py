@@ -0,0 +1,214 @@
+import os
+import time
+import uuid
+import sqlite3
+import logging
+import threading
+
+
+# =====================================================
+# GradHire Single-Flight
+# Coalesce identical in-flight calls by key:
+#   - inside a worker via a shared Event per key
+#   - across workers via a SQLite lease table
+# =====================================================
+
+SINGLE_FLIGHT_PATH = os.getenv(
+    "SINGLE_FLIGHT_PATH",
+    "/tmp/gradhire_single_flight.sqlite3"
+)
+
+LEASE_TTL = 90
+POLL_INTERVAL = 0.2
+
+
+class _Call:
+
+    def __init__(self):
+
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+
+    def __init__(self, lease_path=SINGLE_FLIGHT_PATH, lease_ttl=LEASE_TTL):
+
+        self.lease_path = lease_path
+        self.lease_ttl = lease_ttl
+        self.owner = f"{os.getpid()}:{uuid.uuid4().hex}"
+
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._local = threading.local()
+
+
+    # =====================================================
+    # Public API
+    # =====================================================
+
+    def do(self, key, fn, lookup=None, timeout=None):
+        """
+        Run `fn()` once per key across concurrent callers.
+
+        `lookup()` is used by callers in other workers to pick up the
+        leader's result (e.g. from a shared cache) once it is stored.
+        Followers give up after `timeout` seconds and get None.
+        """
+
+        with self._lock:
+
+            call = self._calls.get(key)
+
+            leader = call is None
+
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+
+            if not call.done.wait(timeout):
+                return None
+
+            if call.error:
+                raise call.error
+
+            return call.result
+
+        try:
+            call.result = self._run_with_lease(key, fn, lookup, timeout)
+
+        except Exception as e:
+            call.error = e
+            raise
+
+        finally:
+
+            with self._lock:
+                self._calls.pop(key, None)
+
+            call.done.set()
+
+        return call.result
+
+
+    # =====================================================
+    # Cross-worker lease
+    # =====================================================
+
+    def _run_with_lease(self, key, fn, lookup, timeout=None):
+
+        now = time.monotonic()
+
+        lease_deadline = now + self.lease_ttl
+        wait_deadline = now + timeout if timeout is not None else None
+
+        while not self._acquire(key):
+
+            if lookup:
+
+                value = lookup()
+
+                if value:
+                    return value
+
+            if wait_deadline is not None and time.monotonic() >= wait_deadline:
+                return None
+
+            # Lease holder died or took too long: run it ourselves
+            if time.monotonic() >= lease_deadline:
+                return fn()
+
+            time.sleep(POLL_INTERVAL)
+
+        try:
+
+            # Another worker may have finished just before we got the lease
+            if lookup:
+
+                value = lookup()
+
+                if value:
+                    return value
+
+            return fn()
+
+        finally:
+            self._release(key)
+
+
+    def _conn(self):
+
+        conn = getattr(self._local, "conn", None)
+
+        if conn is None:
+
+            conn = sqlite3.connect(self.lease_path, timeout=5)
+
+            conn.execute("PRAGMA journal_mode=WAL")
+
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS leases (
+                    key TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    expires REAL NOT NULL
+                )
+                """
+            )
+
+            conn.commit()
+
+            self._local.conn = conn
+
+        return conn
+
+
+    def _acquire(self, key):
+
+        try:
+
+            conn = self._conn()
+
+            now = time.time()
+
+            with conn:
+
+                conn.execute(
+                    "DELETE FROM leases WHERE key = ? AND expires < ?",
+                    (key, now)
+                )
+
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO leases (key, owner, expires) "
+                    "VALUES (?, ?, ?)",
+                    (key, self.owner, now + self.lease_ttl)
+                )
+
+            return cursor.rowcount == 1
+
+        except Exception as e:
+
+            # Never block the request on the lease store
+            logging.warning(f"Single-flight lease failed: {e}")
+
+            return True
+
+
+    def _release(self, key):
+
+        try:
+
+            conn = self._conn()
+
+            with conn:
+                conn.execute(
+                    "DELETE FROM leases WHERE key = ? AND owner = ?",
+                    (key, self.owner)
+                )
+
+        except Exception as e:
+
+            logging.warning(f"Single-flight release failed: {e}")
@@ -0,0 +1,233 @@
+import re
+from typing import List
+
+
+# =====================================================
+# GradHire Skill Vocabulary + Fast Keyword Matching
+# Local, LLM-free missing skills / ATS keywords
+# =====================================================
+
+TECH_KEYWORDS = {
+
+    # languages
+    "python", "java", "javascript", "typescript", "c++", "c#", "go", "swift",
+    "kotlin", "rust", "matlab", "r",
+
+    # web
+    "react", "angular", "vue", "node", "express", "html", "css",
+    "frontend", "backend", "fullstack",
+
+    # database
+    "sql", "mysql", "postgresql", "mongodb", "firebase", "redis",
+
+    # cloud / devops
+    "aws", "azure", "gcp", "docker", "kubernetes", "jenkins",
+    "ci/cd", "devops",
+
+    # mobile
+    "ios", "android", "flutter", "react native",
+
+    # AI/ML
+    "machine learning", "deep learning", "pytorch", "tensorflow",
+    "scikit", "neural network", "nlp", "computer vision",
+    "huggingface",
+
+    # tools / backend
+    "git", "github", "api", "rest", "fastapi", "flask", "django",
+
+    # data
+    "pandas", "numpy", "data analysis", "data science"
+}
+
+
+# Extra skills used by the domain classifier
+CLASSIFIER_KEYWORDS = {
+
+    "next.js", "tailwind", "bootstrap", "spring", "microservices",
+    "swiftui", "xcode", "uikit", "objective-c", "jetpack",
+    "android studio", "terraform",
+}
+
+
+SKILL_VOCABULARY = TECH_KEYWORDS | CLASSIFIER_KEYWORDS
+
+
+# Common spellings mapped to the vocabulary term
+SKILL_ALIASES = {
+
+    "node.js": "node",
+    "nodejs": "node",
+    "react.js": "react",
+    "reactjs": "react",
+    "vue.js": "vue",
+    "nextjs": "next.js",
+    "postgres": "postgresql",
+    "k8s": "kubernetes",
+    "golang": "go",
+    "scikit-learn": "scikit",
+    "sklearn": "scikit",
+    "ci / cd": "ci/cd",
+    "full stack": "fullstack",
+    "full-stack": "fullstack",
+    "rest api": "rest",
+    "restful": "rest",
+}
+
+
+# Single words that are also plain English: only match the exact casing
+CASE_SENSITIVE_SKILLS = {"r": "R", "go": "Go", "rest": "REST"}
+
+
+# Vocabulary term -> how it is shown to users
+SKILL_LABELS = {
+
+    "python": "Python", "java": "Java", "javascript": "JavaScript",
+    "typescript": "TypeScript", "c++": "C++", "c#": "C#", "go": "Go",
+    "swift": "Swift", "kotlin": "Kotlin", "rust": "Rust", "matlab": "MATLAB",
+    "r": "R",
+
+    "react": "React", "angular": "Angular", "vue": "Vue", "node": "Node.js",
+    "express": "Express", "html": "HTML", "css": "CSS",
+    "frontend": "Frontend", "backend": "Backend", "fullstack": "Full Stack",
+
+    "sql": "SQL", "mysql": "MySQL", "postgresql": "PostgreSQL",
+    "mongodb": "MongoDB", "firebase": "Firebase", "redis": "Redis",
+
+    "aws": "AWS", "azure": "Azure", "gcp": "GCP", "docker": "Docker",
+    "kubernetes": "Kubernetes", "jenkins": "Jenkins", "ci/cd": "CI/CD",
+    "devops": "DevOps",
+
+    "ios": "iOS", "android": "Android", "flutter": "Flutter",
+    "react native": "React Native",
+
+    "machine learning": "Machine Learning", "deep learning": "Deep Learning",
+    "pytorch": "PyTorch", "tensorflow": "TensorFlow",
+    "scikit": "scikit-learn", "neural network": "Neural Networks",
+    "nlp": "NLP", "computer vision": "Computer Vision",
+    "huggingface": "Hugging Face",
+
+    "git": "Git", "github": "GitHub", "api": "APIs", "rest": "REST",
+    "fastapi": "FastAPI", "flask": "Flask", "django": "Django",
+
+    "pandas": "pandas", "numpy": "NumPy", "data analysis": "Data Analysis",
+    "data science": "Data Science",
+
+    "next.js": "Next.js", "tailwind": "Tailwind CSS", "bootstrap": "Bootstrap",
+    "spring": "Spring", "microservices": "Microservices",
+    "swiftui": "SwiftUI", "xcode": "Xcode", "uikit": "UIKit",
+    "objective-c": "Objective-C", "jetpack": "Jetpack",
+    "android studio": "Android Studio", "terraform": "Terraform",
+}
+
+
+def skill_label(term: str) -> str:
+
+    return SKILL_LABELS.get(term, term)
+
+
+def _compile(terms, flags=0):
+
+    alternation = "|".join(
+        re.escape(term)
+        for term in sorted(terms, key=len, reverse=True)
+    )
+
+    return re.compile(
+        rf"(?<![\w+#./-])({alternation})(?![\w+#/-]|\.\w)",
+        flags
+    )
+
+
+_SKILL_RE = _compile(
+    (SKILL_VOCABULARY | set(SKILL_ALIASES)) - set(CASE_SENSITIVE_SKILLS),
+    re.IGNORECASE
+)
+
+_CASE_SENSITIVE_RE = _compile(CASE_SENSITIVE_SKILLS.values())
+
+
+# =====================================================
+# EXTRACTION
+# =====================================================
+
+def extract_skills(text: str) -> List[str]:
+
+    if not text:
+        return []
+
+    found = {}
+
+    for match in _SKILL_RE.finditer(text):
+
+        term = match.group(1).lower()
+
+        term = SKILL_ALIASES.get(term, term)
+
+        found.setdefault(term, match.start())
+
+    for match in _CASE_SENSITIVE_RE.finditer(text):
+
+        term = match.group(1).lower()
+
+        found.setdefault(term, match.start())
+
+    return sorted(found, key=found.get)
+
+
+# =====================================================
+# FAST MODE
+# =====================================================
+
+def fast_keyword_match(
+    resume_text: str,
+    job_description: str,
+    resume_skills: List[str] = None
+) -> dict:
+
+    # resume_skills: extract_skills(resume_text), when already known
+    if resume_skills is None:
+        resume_skills = extract_skills(resume_text)
+
+    resume_skills = set(resume_skills)
+
+    job_skills = extract_skills(job_description)
+
+    matched = [skill_label(s) for s in job_skills if s in resume_skills]
+
+    # ats_keywords: job description keywords the resume already covers.
+    # Every optimize path reports this same list
+    return {
+        "missing_skills": [skill_label(s) for s in job_skills if s not in resume_skills],
+        "matched_skills": matched,
+        "ats_keywords": matched,
+    }
+
+
+def covered_keywords(
+    keywords: List[str],
+    skills: List[str],
+    job_description: str
+) -> List[str]:
+
+    # Adds the candidate's skills (e.g. the model's list) that the job
+    # description names but the vocabulary does not know ("Kafka")
+    covered = list(keywords)
+
+    seen = {keyword.lower() for keyword in keywords}
+
+    for skill in skills:
+
+        if not isinstance(skill, str) or skill.strip().lower() in seen:
+            continue
+
+        skill = skill.strip()
+
+        if skill and re.search(
+            rf"(?<![\w+#]){re.escape(skill)}(?![\w+#])",
+            job_description,
+            re.IGNORECASE
+        ):
+            covered.append(skill)
+            seen.add(skill.lower())
+
+    return covered
@@ -0,0 +1,273 @@
+import os
+import time
+import uuid
+import sqlite3
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services import metrics
+
+
+# =====================================================
+# GradHire Background Tasks
+# Submit/poll execution of long pipelines (e.g. resume
+# download) on a local worker pool. Status and results live
+# in a SQLite table so any worker can answer a poll
+# =====================================================
+
+TASKS_PATH = os.getenv("TASKS_PATH", "/tmp/gradhire_tasks.sqlite3")
+TASK_WORKERS = int(os.getenv("TASK_WORKERS", "4"))
+TASK_MAX_PENDING = int(os.getenv("TASK_MAX_PENDING", "32"))
+TASK_TTL = int(os.getenv("TASK_TTL", str(60 * 60)))
+
+# Queued/running tasks not updated for this long belong to a dead worker
+TASK_STALE_AFTER = int(os.getenv("TASK_STALE_AFTER", str(10 * 60)))
+
+TASK_RETRY_AFTER = 5
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+TASKS = metrics.Gauge(
+    "gradhire_tasks",
+    "Background tasks owned by this worker, by status.",
+    ["status"]
+)
+
+TASK_DURATION = metrics.Histogram(
+    "gradhire_task_duration_seconds",
+    "Background task run time, by kind.",
+    ["kind"]
+)
+
+
+class TaskQueueFull(Exception):
+    pass
+
+
+class TaskFailed(Exception):
+    """Raised by a task with a message that is safe to show the client."""
+
+
+_executor = ThreadPoolExecutor(
+    max_workers=TASK_WORKERS,
+    thread_name_prefix="gradhire-task"
+)
+
+_lock = threading.Lock()
+_conn = None
+_pending = 0
+
+
+def _get_conn():
+
+    global _conn
+
+    if _conn is None:
+
+        _conn = sqlite3.connect(
+            TASKS_PATH,
+            timeout=5,
+            check_same_thread=False
+        )
+
+        _conn.execute("PRAGMA journal_mode=WAL")
+
+        _conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tasks (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                error TEXT,
+                result BLOB,
+                created REAL NOT NULL,
+                updated REAL NOT NULL,
+                expires REAL NOT NULL
+            )
+            """
+        )
+
+        _conn.commit()
+
+    return _conn
+
+
+def _update(task_id, status, error=None, result=None):
+
+    now = time.time()
+
+    with _lock:
+
+        conn = _get_conn()
+
+        conn.execute(
+            "UPDATE tasks SET status = ?, error = ?, result = ?, "
+            "updated = ?, expires = ? WHERE id = ?",
+            (
+                status,
+                error,
+                sqlite3.Binary(result) if result is not None else None,
+                now,
+                now + TASK_TTL,
+                task_id
+            )
+        )
+
+        conn.commit()
+
+
+# =====================================================
+# SUBMIT
+# =====================================================
+
+def submit(kind: str, fn, *args) -> str:
+    """
+    Queue `fn(*args)` (which returns bytes) and return its task id.
+    Raises TaskQueueFull when too many tasks are queued or running.
+    """
+
+    global _pending
+
+    with _lock:
+
+        if _pending >= TASK_MAX_PENDING:
+            raise TaskQueueFull()
+
+        _pending += 1
+
+    task_id = uuid.uuid4().hex
+
+    now = time.time()
+
+    try:
+
+        with _lock:
+
+            conn = _get_conn()
+
+            conn.execute("DELETE FROM tasks WHERE expires < ?", (now,))
+
+            conn.execute(
+                "INSERT INTO tasks (id, kind, status, created, updated, expires) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (task_id, kind, QUEUED, now, now, now + TASK_TTL)
+            )
+
+            conn.commit()
+
+    except Exception:
+
+        with _lock:
+            _pending -= 1
+
+        raise
+
+    TASKS.inc(status=QUEUED)
+
+    _executor.submit(_run, task_id, kind, fn, args)
+
+    return task_id
+
+
+def _run(task_id, kind, fn, args):
+
+    global _pending
+
+    TASKS.dec(status=QUEUED)
+    TASKS.inc(status=RUNNING)
+
+    started = time.perf_counter()
+
+    try:
+
+        _update(task_id, RUNNING)
+
+        result = fn(*args)
+
+        _update(task_id, DONE, result=result)
+
+    except TaskFailed as e:
+
+        _update(task_id, FAILED, error=str(e))
+
+    except Exception as e:
+
+        logging.error(f"Task {kind} {task_id} failed: {e}")
+
+        try:
+            _update(task_id, FAILED, error="Task failed")
+        except Exception as e:
+            logging.error(f"Task status update failed: {e}")
+
+    finally:
+
+        TASK_DURATION.observe(time.perf_counter() - started, kind=kind)
+        TASKS.dec(status=RUNNING)
+
+        with _lock:
+            _pending -= 1
+
+
+# =====================================================
+# POLL / RESULT
+# =====================================================
+
+def status(task_id: str):
+
+    try:
+
+        with _lock:
+
+            row = _get_conn().execute(
+                "SELECT kind, status, error, created, updated FROM tasks "
+                "WHERE id = ? AND expires >= ?",
+                (task_id, time.time())
+            ).fetchone()
+
+    except Exception as e:
+
+        logging.warning(f"Task lookup failed: {e}")
+
+        return None
+
+    if row is None:
+        return None
+
+    kind, state, error, created, updated = row
+
+    if state in (QUEUED, RUNNING) and time.time() - updated > TASK_STALE_AFTER:
+        state, error = FAILED, "Task interrupted"
+
+    return {
+        "task_id": task_id,
+        "kind": kind,
+        "status": state,
+        "error": error,
+        "created": created,
+        "updated": updated,
+    }
+
+
+def result(task_id: str):
+
+    try:
+
+        with _lock:
+
+            row = _get_conn().execute(
+                "SELECT result FROM tasks "
+                "WHERE id = ? AND status = ? AND expires >= ?",
+                (task_id, DONE, time.time())
+            ).fetchone()
+
+    except Exception as e:
+
+        logging.warning(f"Task result lookup failed: {e}")
+
+        return None
+
+    return bytes(row[0]) if row and row[0] is not None else None
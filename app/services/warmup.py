@@ -0,0 +1,119 @@
+import os
+import time
+import logging
+import importlib
+
+from app.services import metrics
+
+
+# =====================================================
+# GradHire Warmup
+# Pays first-use costs (heavy imports, regex compilation,
+# font metrics, connection pools, PDF parsing) at startup
+# instead of on the first requests
+# =====================================================
+
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "1") != "0"
+
+# Block startup until warmup finishes (otherwise it runs in the background
+# and /ready reports 503 until it is done)
+WARMUP_BLOCKING = os.getenv("WARMUP_BLOCKING", "0") == "1"
+
+SAMPLE_PDF_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    "assets",
+    "sample_resume.pdf"
+)
+
+# Modules kept out of the import path of app.main
+HEAVY_MODULES = (
+    "openai",
+    "pdfplumber",
+    "reportlab.pdfgen.canvas",
+    "reportlab.pdfbase.pdfmetrics",
+    "requests",
+)
+
+READY = metrics.Gauge(
+    "gradhire_ready",
+    "1 once startup warmup has finished."
+)
+
+_state = {
+    "ready": False,
+    "started": None,
+    "duration": None,
+    "steps": {},
+    "errors": {},
+}
+
+
+def sample_pdf() -> bytes:
+
+    with open(SAMPLE_PDF_PATH, "rb") as f:
+        return f.read()
+
+
+def import_heavy_modules():
+
+    for name in HEAVY_MODULES:
+        importlib.import_module(name)
+
+
+# =====================================================
+# RUN / STATUS
+# =====================================================
+
+def run(steps):
+    """
+    Run `(name, fn)` steps in order. Warmup is best-effort: a failing
+    step is logged and recorded, and the process still becomes ready.
+    """
+
+    started = time.perf_counter()
+
+    _state["started"] = time.time()
+
+    for name, fn in steps:
+
+        step_started = time.perf_counter()
+
+        try:
+            fn()
+
+        except Exception as e:
+
+            logging.warning(f"Warmup step {name} failed: {e}")
+
+            _state["errors"][name] = str(e)
+
+        _state["steps"][name] = round(time.perf_counter() - step_started, 4)
+
+    _state["duration"] = round(time.perf_counter() - started, 4)
+
+    mark_ready()
+
+    logging.info(f"Warmup finished in {_state['duration']}s")
+
+
+def mark_ready():
+
+    _state["ready"] = True
+
+    READY.set(1)
+
+
+def is_ready() -> bool:
+
+    return _state["ready"]
+
+
+def status() -> dict:
+
+    return {
+        "ready": _state["ready"],
+        "started": _state["started"],
+        "duration": _state["duration"],
+        "steps": dict(_state["steps"]),
+        "errors": dict(_state["errors"]),
+    }
@@ -0,0 +1,91 @@
+import zipfile
+
+from app.services.pdf_output import CHUNK_SIZE
+
+
+# =====================================================
+# GradHire Streaming ZIP Writer
+# Builds an archive on an unseekable sink and hands back
+# bytes as they are produced (never the whole archive)
+# =====================================================
+
+class _Sink:
+
+    def __init__(self):
+
+        self._chunks = []
+
+
+    def write(self, data):
+
+        self._chunks.append(bytes(data))
+
+        return len(data)
+
+
+    def flush(self):
+        pass
+
+
+    def drain(self) -> bytes:
+
+        data = b"".join(self._chunks)
+
+        self._chunks.clear()
+
+        return data
+
+
+class ZipStream:
+    """
+    Usage:
+        archive = ZipStream()
+        for chunk in archive.add(name, buffer): yield chunk
+        yield archive.close()
+    """
+
+    def __init__(self, compression=zipfile.ZIP_STORED):
+
+        self._sink = _Sink()
+
+        # No tell()/seek() on the sink: zipfile falls back to data
+        # descriptors, so entries can be written strictly in order
+        self._zip = zipfile.ZipFile(self._sink, mode="w", compression=compression)
+
+
+    def add(self, name, buffer, chunk_size=CHUNK_SIZE):
+
+        with self._zip.open(name, mode="w") as entry:
+
+            while True:
+
+                chunk = buffer.read(chunk_size)
+
+                if not chunk:
+                    break
+
+                entry.write(chunk)
+
+                data = self._sink.drain()
+
+                if data:
+                    yield data
+
+        data = self._sink.drain()
+
+        if data:
+            yield data
+
+
+    def add_bytes(self, name, data: bytes):
+
+        self._zip.writestr(name, data)
+
+        return self._sink.drain()
+
+
+    def close(self) -> bytes:
+
+        self._zip.close()
+
+        return self._sink.drain()
@@ -0,0 +1,131 @@
+"""
+Benchmark: resume_builder (raw canvas) vs pdf_generator (platypus).
+
+    python -m benchmarks.bench_pdf_engines [--iterations 200] [--warmup 10]
+                                           [--fixtures benchmarks/fixtures/resumes.json]
+                                           [--json results.json]
+
+Renders every resume_data fixture through both engines and reports
+ops/sec, p50/p99 latency, peak traced memory and bytes per PDF.
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import time
+import tracemalloc
+
+from app.services.resume_builder import build_resume_pdf
+from app.services.pdf_generator import generate_resume_pdf
+
+
+DEFAULT_FIXTURES = os.path.join(
+    os.path.dirname(__file__), "fixtures", "resumes.json"
+)
+
+ENGINES = {
+    "canvas": build_resume_pdf,
+    "platypus": generate_resume_pdf,
+}
+
+
+def percentile(values, pct):
+
+    ordered = sorted(values)
+
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+
+    return ordered[index]
+
+
+def render_once(engine, resume_data):
+
+    buffer = engine(resume_data)
+
+    try:
+        return len(buffer.read())
+    finally:
+        buffer.close()
+
+
+def bench(engine, resume_data, iterations, warmup):
+
+    for _ in range(warmup):
+        render_once(engine, resume_data)
+
+    gc.collect()
+
+    latencies = []
+
+    started = time.perf_counter()
+
+    for _ in range(iterations):
+
+        t0 = time.perf_counter()
+        size = render_once(engine, resume_data)
+        latencies.append(time.perf_counter() - t0)
+
+    elapsed = time.perf_counter() - started
+
+    # Peak memory measured separately: tracing slows rendering down
+    tracemalloc.start()
+    render_once(engine, resume_data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "ops_per_sec": iterations / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "peak_kib": peak / 1024,
+        "bytes": size,
+    }
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES)
+    parser.add_argument("--json", help="write raw results to this file")
+    args = parser.parse_args()
+
+    with open(args.fixtures) as f:
+        fixtures = json.load(f)
+
+    results = []
+
+    header = (
+        f"{'fixture':<14} {'engine':<9} {'ops/s':>8} {'p50 ms':>8} "
+        f"{'p99 ms':>8} {'peak KiB':>9} {'bytes':>7}"
+    )
+
+    print(header)
+    print("-" * len(header))
+
+    for fixture_name, resume_data in fixtures.items():
+
+        for engine_name, engine in ENGINES.items():
+
+            row = bench(engine, resume_data, args.iterations, args.warmup)
+            row.update(fixture=fixture_name, engine=engine_name)
+
+            results.append(row)
+
+            print(
+                f"{fixture_name:<14} {engine_name:<9} {row['ops_per_sec']:>8.1f} "
+                f"{row['p50_ms']:>8.2f} {row['p99_ms']:>8.2f} "
+                f"{row['peak_kib']:>9.1f} {row['bytes']:>7}"
+            )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import os
+import json
+
+
+# =====================================================
+# Sample resumes shared by the benchmarks and the load
+# driver (resume_data dicts, as /resume/render takes)
+# =====================================================
+
+RESUMES_PATH = os.path.join(os.path.dirname(__file__), "resumes.json")
+
+
+def load_resumes() -> dict:
+
+    with open(RESUMES_PATH) as f:
+        return json.load(f)
+
+
+def resume_text(data: dict) -> str:
+
+    # Plain-text form of a fixture, laid out like extracted PDF text
+    lines = [data.get("name", ""), data.get("contact", ""), "Summary", data.get("summary", "")]
+
+    lines.append("Technical Skills")
+    lines.append(", ".join(data.get("skills", [])))
+
+    lines.append("Experience")
+
+    for job in data.get("experience", []):
+        lines.append(f"{job.get('title', '')} {job.get('company', '')} {job.get('duration', '')}")
+        lines.extend(job.get("bullets", []))
+
+    lines.append("Projects")
+
+    for project in data.get("projects", []):
+        lines.append(project.get("title", ""))
+        lines.extend(project.get("bullets", []))
+
+    lines.append("Education")
+
+    for edu in data.get("education", []):
+        lines.append(f"{edu.get('degree', '')} {edu.get('school', '')} {edu.get('duration', '')}")
+
+    return "\n".join(line for line in lines if line)
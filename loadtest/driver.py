@@ -0,0 +1,395 @@
+"""
+Load driver for the GradHire API.
+
+    python -m loadtest.driver [--base-url http://127.0.0.1:8000]
+                              [--concurrency 16] [--duration 60]
+                              [--mix optimize=3,download=1,jobs=1]
+                              [--pdf my_resume.pdf ...] [--cache-bust]
+                              [--json results.json]
+
+Runs `--concurrency` closed-loop clients for `--duration` seconds. Each
+iteration picks an endpoint from the weighted mix. At the end it reports
+throughput, p50/p95/p99 latency and status codes per endpoint.
+
+Sample PDFs are rendered from benchmarks/fixtures/resumes.json unless
+--pdf is given. Start the backend against the stubs (see loadtest.stubs)
+so runs cost nothing. Use --cache-bust (or CACHE_ENABLED=0 on the server)
+to measure cold paths instead of cache hits.
+"""
+
+import json
+import time
+import uuid
+import random
+import asyncio
+import argparse
+from collections import Counter, defaultdict
+
+import httpx
+
+from app.services.resume_builder import build_resume_pdf
+from benchmarks.fixtures import load_resumes, resume_text
+
+
+JOB_DESCRIPTIONS = [
+    "Junior backend engineer to build REST APIs with Python, FastAPI and "
+    "PostgreSQL. Docker and AWS experience is a plus. Fresh graduates welcome.",
+    "Graduate software developer for our React and Node.js web platform. "
+    "Experience with TypeScript, Git and CI/CD pipelines preferred.",
+    "Entry level data engineer working with Python, SQL, pandas and GCP to "
+    "build reliable batch pipelines. Kubernetes knowledge is a bonus.",
+]
+
+TASK_POLL_INTERVAL = 0.25
+
+# Shorter fixtures are rejected by the upload validator (is_valid_resume)
+MIN_UPLOAD_WORDS = 120
+
+
+# =====================================================
+# SAMPLE DATA
+# =====================================================
+
+def load_samples(pdf_paths):
+
+    resumes = list(load_resumes().values())
+
+    if pdf_paths:
+
+        pdfs = []
+
+        for path in pdf_paths:
+            with open(path, "rb") as f:
+                pdfs.append(f.read())
+
+    else:
+
+        pdfs = []
+
+        for data in resumes:
+
+            if len(resume_text(data).split()) < MIN_UPLOAD_WORDS:
+                continue
+
+            buffer = build_resume_pdf(data)
+            pdfs.append(buffer.read())
+            buffer.close()
+
+    return {
+        "pdfs": pdfs,
+        "resumes": resumes,
+        "texts": [resume_text(data) for data in resumes],
+    }
+
+
+# =====================================================
+# SCENARIOS (ONE ITERATION EACH, RETURN THE STATUS CODE)
+# =====================================================
+
+def job_description(args):
+
+    jd = random.choice(JOB_DESCRIPTIONS)
+
+    if args.cache_bust:
+        jd += f" Ref {uuid.uuid4().hex[:8]}."
+
+    return jd
+
+
+def pdf_upload(samples):
+
+    return {"file": ("resume.pdf", random.choice(samples["pdfs"]), "application/pdf")}
+
+
+async def run_upload(client, samples, args):
+
+    response = await client.post("/resume/upload", files=pdf_upload(samples))
+
+    return response.status_code
+
+
+async def run_jobs(client, samples, args):
+
+    response = await client.post(
+        "/jobs/from-resume",
+        params={"country": "in"},
+        files=pdf_upload(samples)
+    )
+
+    return response.status_code
+
+
+async def run_optimize(client, samples, args, mode="llm"):
+
+    response = await client.post(
+        "/resume/optimize",
+        params={"mode": mode},
+        json={
+            "resume_text": random.choice(samples["texts"]),
+            "job_description": job_description(args)
+        }
+    )
+
+    return response.status_code
+
+
+async def run_optimize_fast(client, samples, args):
+
+    return await run_optimize(client, samples, args, mode="fast")
+
+
+async def run_optimize_stream(client, samples, args):
+
+    payload = {
+        "resume_text": random.choice(samples["texts"]),
+        "job_description": job_description(args)
+    }
+
+    async with client.stream("POST", "/resume/optimize/stream", json=payload) as response:
+
+        async for _ in response.aiter_bytes():
+            pass
+
+        return response.status_code
+
+
+async def run_optimize_batch(client, samples, args):
+
+    payload = {
+        "resume_text": random.choice(samples["texts"]),
+        "job_descriptions": [job_description(args) for _ in range(3)]
+    }
+
+    async with client.stream("POST", "/resume/optimize/batch", json=payload) as response:
+
+        async for _ in response.aiter_bytes():
+            pass
+
+        return response.status_code
+
+
+async def run_download(client, samples, args):
+
+    response = await client.post(
+        "/resume/download",
+        files=pdf_upload(samples),
+        data={"job_description": job_description(args)}
+    )
+
+    return response.status_code
+
+
+async def run_download_task(client, samples, args):
+
+    # Measured end to end: submit, poll, fetch the PDF
+    response = await client.post(
+        "/resume/download/tasks",
+        files=pdf_upload(samples),
+        data={"job_description": job_description(args)}
+    )
+
+    if response.status_code != 202:
+        return response.status_code
+
+    result_url = response.json()["result_url"]
+
+    while True:
+
+        response = await client.get(result_url)
+
+        if response.status_code != 202:
+            return response.status_code
+
+        await asyncio.sleep(TASK_POLL_INTERVAL)
+
+
+async def run_render_batch(client, samples, args):
+
+    payload = {"resumes": [random.choice(samples["resumes"]) for _ in range(5)]}
+
+    async with client.stream("POST", "/resume/render/batch", json=payload) as response:
+
+        async for _ in response.aiter_bytes():
+            pass
+
+        return response.status_code
+
+
+async def run_metrics(client, samples, args):
+
+    response = await client.get("/metrics")
+
+    return response.status_code
+
+
+SCENARIOS = {
+    "upload": run_upload,
+    "jobs": run_jobs,
+    "optimize": run_optimize,
+    "optimize_fast": run_optimize_fast,
+    "optimize_stream": run_optimize_stream,
+    "optimize_batch": run_optimize_batch,
+    "download": run_download,
+    "download_task": run_download_task,
+    "render_batch": run_render_batch,
+    "metrics": run_metrics,
+}
+
+
+# =====================================================
+# DRIVER
+# =====================================================
+
+def parse_mix(text):
+
+    if not text:
+        return {name: 1.0 for name in SCENARIOS}
+
+    mix = {}
+
+    for part in text.split(","):
+
+        name, _, weight = part.partition("=")
+        name = name.strip()
+
+        if name not in SCENARIOS:
+            raise SystemExit(f"Unknown endpoint '{name}' (choose from {', '.join(SCENARIOS)})")
+
+        mix[name] = float(weight or 1)
+
+    return mix
+
+
+async def client_loop(client, samples, args, mix, deadline, results):
+
+    names = list(mix)
+    weights = [mix[name] for name in names]
+
+    while time.monotonic() < deadline:
+
+        name = random.choices(names, weights)[0]
+
+        started = time.perf_counter()
+
+        try:
+            status = await SCENARIOS[name](client, samples, args)
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+
+        results[name].append((time.perf_counter() - started, status))
+
+
+def percentile(values, pct):
+
+    ordered = sorted(values)
+
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+
+    return ordered[index]
+
+
+def summarize(results, elapsed):
+
+    summary = {}
+
+    for name, samples in sorted(results.items()):
+
+        latencies = [latency for latency, _ in samples]
+        statuses = Counter(str(status) for _, status in samples)
+
+        ok = sum(
+            count for status, count in statuses.items()
+            if status.isdigit() and 200 <= int(status) < 300
+        )
+
+        summary[name] = {
+            "requests": len(samples),
+            "ok": ok,
+            "throughput_rps": len(samples) / elapsed,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+            "statuses": dict(statuses),
+        }
+
+    return summary
+
+
+def print_summary(summary, elapsed):
+
+    header = (
+        f"{'endpoint':<16} {'reqs':>6} {'ok':>6} {'rps':>7} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  statuses"
+    )
+
+    print(f"\n{elapsed:.1f}s")
+    print(header)
+    print("-" * len(header))
+
+    for name, row in summary.items():
+
+        statuses = " ".join(f"{status}:{count}" for status, count in sorted(row["statuses"].items()))
+
+        print(
+            f"{name:<16} {row['requests']:>6} {row['ok']:>6} {row['throughput_rps']:>7.2f} "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f}  {statuses}"
+        )
+
+
+async def run(args):
+
+    samples = load_samples(args.pdf)
+
+    mix = parse_mix(args.mix)
+
+    results = defaultdict(list)
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        timeout=args.timeout,
+        limits=limits
+    ) as client:
+
+        started = time.monotonic()
+        deadline = started + args.duration
+
+        await asyncio.gather(*[
+            client_loop(client, samples, args, mix, deadline, results)
+            for _ in range(args.concurrency)
+        ])
+
+        elapsed = time.monotonic() - started
+
+    return summarize(results, elapsed), elapsed
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="GradHire load driver")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--mix", help="weighted endpoints, e.g. optimize=3,download=1")
+    parser.add_argument("--pdf", nargs="*", help="resume PDFs to upload")
+    parser.add_argument("--cache-bust", action="store_true", help="make every job description unique")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--json", help="write the summary to this file")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    summary, elapsed = asyncio.run(run(args))
+
+    print_summary(summary, elapsed)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
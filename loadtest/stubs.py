@@ -0,0 +1,308 @@
+"""
+Local stand-ins for Adzuna and OpenAI, for load testing without
+spending API quota.
+
+    python -m loadtest.stubs [--port 9100] [--latency-ms 300] [--jitter-ms 100]
+                             [--error-rate 0.02] [--error-status 503]
+                             [--openai-latency-ms 1500] [--openai-error-status 429]
+
+Point the backend at it:
+
+    ADZUNA_BASE_URL=http://127.0.0.1:9100/v1/api/jobs \
+    ADZUNA_APP_ID=stub ADZUNA_API_KEY=stub \
+    OPENAI_BASE_URL=http://127.0.0.1:9100/v1 OPENAI_API_KEY=stub \
+    uvicorn app.main:app --port 8000
+
+Responses are replayed from loadtest/recordings/. The same request
+always gets the same recording, so runs are repeatable. Drop captured
+responses into those files (same shape) to replay real traffic.
+"""
+
+import os
+import json
+import time
+import uuid
+import random
+import asyncio
+import hashlib
+import argparse
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+RECORDINGS_DIR = os.path.join(os.path.dirname(__file__), "recordings")
+
+# Per-upstream behaviour, overridden from the command line
+PROFILES = {
+    "adzuna": {
+        "latency_ms": 300,
+        "jitter_ms": 100,
+        "error_rate": 0.0,
+        "error_status": 503,
+    },
+    "openai": {
+        "latency_ms": 1500,
+        "jitter_ms": 500,
+        "error_rate": 0.0,
+        "error_status": 429,
+        # Streamed responses spread the latency across chunks
+        "chunk_chars": 24,
+    },
+}
+
+# Only sent with 429 responses (the optimizer honours it)
+RETRY_AFTER = "1"
+
+app = FastAPI(title="GradHire upstream stubs")
+
+
+def _load(name):
+
+    with open(os.path.join(RECORDINGS_DIR, name)) as f:
+        return json.load(f)
+
+
+ADZUNA_PAGES = _load("adzuna_search.json")["pages"]
+OPENAI_COMPLETIONS = _load("openai_chat.json")["completions"]
+
+
+def _pick(items, *parts):
+
+    digest = hashlib.sha256("\n".join(map(str, parts)).encode("utf-8")).digest()
+
+    return items[int.from_bytes(digest[:4], "big") % len(items)]
+
+
+async def _delay(profile):
+
+    latency = profile["latency_ms"] + random.uniform(
+        -profile["jitter_ms"], profile["jitter_ms"]
+    )
+
+    await asyncio.sleep(max(0.0, latency) / 1000)
+
+
+def _injected_error(profile):
+
+    if random.random() >= profile["error_rate"]:
+        return None
+
+    status = profile["error_status"]
+
+    headers = {"Retry-After": RETRY_AFTER} if status == 429 else {}
+
+    return JSONResponse(
+        status_code=status,
+        content={"error": {"message": "Injected stub error", "type": "stub_error"}},
+        headers=headers
+    )
+
+
+# =====================================================
+# ADZUNA
+# =====================================================
+
+def _matches(job, params):
+
+    where = params.get("where")
+
+    if where and where.lower() not in job["location"]["display_name"].lower():
+        return False
+
+    salary_min = params.get("salary_min")
+
+    if salary_min and job.get("salary_max", 0) < float(salary_min):
+        return False
+
+    for flag, field in (
+        ("permanent", "contract_type"), ("contract", "contract_type"),
+        ("full_time", "contract_time"), ("part_time", "contract_time"),
+    ):
+        if params.get(flag) == "1" and job.get(field) != flag:
+            return False
+
+    return True
+
+
+@app.get("/v1/api/jobs/{country}/search/{page}")
+async def adzuna_search(request: Request, country: str, page: int):
+
+    profile = PROFILES["adzuna"]
+
+    await _delay(profile)
+
+    error = _injected_error(profile)
+
+    if error is not None:
+        return error
+
+    recorded = ADZUNA_PAGES[(page - 1) % len(ADZUNA_PAGES)]
+
+    # Same filters the real API applies server-side
+    results = [job for job in recorded["results"] if _matches(job, request.query_params)]
+
+    return {**recorded, "results": results}
+
+
+# =====================================================
+# OPENAI CHAT COMPLETIONS
+# =====================================================
+
+@app.get("/v1/models")
+async def list_models():
+
+    # Used by the backend's warmup to open its connection pool
+    return {
+        "object": "list",
+        "data": [{"id": "gpt-4o-mini", "object": "model", "created": 0, "owned_by": "stub"}],
+    }
+
+
+def _completion_id():
+
+    return f"chatcmpl-stub{uuid.uuid4().hex[:20]}"
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+
+    profile = PROFILES["openai"]
+
+    body = await request.json()
+
+    messages = body.get("messages", [])
+
+    prompt_text = "".join(str(m.get("content", "")) for m in messages)
+
+    content = json.dumps(_pick(OPENAI_COMPLETIONS, prompt_text))
+
+    # Rough token counts (about 4 characters per token)
+    usage = {
+        "prompt_tokens": len(prompt_text) // 4,
+        "completion_tokens": len(content) // 4,
+    }
+    usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+
+    model = body.get("model", "gpt-4o-mini")
+
+    if body.get("stream"):
+
+        error = _injected_error(profile)
+
+        if error is not None:
+            return error
+
+        include_usage = (body.get("stream_options") or {}).get("include_usage")
+
+        return StreamingResponse(
+            _stream_chunks(profile, model, content, usage if include_usage else None),
+            media_type="text/event-stream"
+        )
+
+    await _delay(profile)
+
+    error = _injected_error(profile)
+
+    if error is not None:
+        return error
+
+    return {
+        "id": _completion_id(),
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "logprobs": None,
+            "finish_reason": "stop",
+        }],
+        "usage": usage,
+    }
+
+
+async def _stream_chunks(profile, model, content, usage):
+
+    completion_id = _completion_id()
+    created = int(time.time())
+
+    size = profile["chunk_chars"]
+    pieces = [content[i:i + size] for i in range(0, len(content), size)]
+
+    per_chunk = profile["latency_ms"] / max(1, len(pieces)) / 1000
+
+    def event(choices, extra=None):
+
+        chunk = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": choices,
+        }
+
+        if extra:
+            chunk.update(extra)
+
+        return f"data: {json.dumps(chunk)}\n\n"
+
+    yield event([{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}])
+
+    for piece in pieces:
+
+        await asyncio.sleep(per_chunk)
+
+        yield event([{"index": 0, "delta": {"content": piece}, "finish_reason": None}])
+
+    yield event([{"index": 0, "delta": {}, "finish_reason": "stop"}])
+
+    if usage is not None:
+        yield event([], {"usage": usage})
+
+    yield "data: [DONE]\n\n"
+
+
+# =====================================================
+# ENTRY POINT
+# =====================================================
+
+def main():
+
+    parser = argparse.ArgumentParser(description="GradHire upstream stubs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+
+    # Shared defaults, then per-upstream overrides
+    parser.add_argument("--latency-ms", type=float)
+    parser.add_argument("--jitter-ms", type=float)
+    parser.add_argument("--error-rate", type=float)
+    parser.add_argument("--error-status", type=int)
+
+    for upstream in PROFILES:
+        parser.add_argument(f"--{upstream}-latency-ms", type=float)
+        parser.add_argument(f"--{upstream}-jitter-ms", type=float)
+        parser.add_argument(f"--{upstream}-error-rate", type=float)
+        parser.add_argument(f"--{upstream}-error-status", type=int)
+
+    args = vars(parser.parse_args())
+
+    for upstream, profile in PROFILES.items():
+
+        for setting in ("latency_ms", "jitter_ms", "error_rate", "error_status"):
+
+            value = args.get(f"{upstream}_{setting}")
+
+            if value is None:
+                value = args.get(setting)
+
+            if value is not None:
+                profile[setting] = value
+
+    import uvicorn
+
+    uvicorn.run(app, host=args["host"], port=args["port"], log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+from app.services.json_stream import IncrementalJSONParser
+
+
+DOCUMENT = (
+    '{"missing_skills": ["Go", "Kafka"], '
+    '"experience": [{"index": 0, "bullets": ["Built \\"X\\"", "Shipped Y"]}], '
+    '"count": 12}'
+)
+
+
+def bullets(path):
+
+    return len(path) == 4 and path[0] == "experience" and path[2] == "bullets"
+
+
+def test_values_complete_across_chunks():
+
+    parser = IncrementalJSONParser(bullets)
+
+    events = []
+
+    for i in range(0, len(DOCUMENT), 3):
+        events.extend(parser.feed(DOCUMENT[i:i + 3]))
+
+    assert events == [
+        (("experience", 0, "bullets", 0), 'Built "X"'),
+        (("experience", 0, "bullets", 1), "Shipped Y"),
+    ]
+
+
+def test_value_is_emitted_once_complete():
+
+    parser = IncrementalJSONParser(lambda path: path == ("missing_skills", 0))
+
+    assert parser.feed('{"missing_skills": ["G') == []
+    assert parser.feed('o", "Ka') == [(("missing_skills", 0), "Go")]
+
+
+def test_containers_and_scalars():
+
+    parser = IncrementalJSONParser(lambda path: path in (("missing_skills",), ("count",)))
+
+    assert parser.feed(DOCUMENT) == [
+        (("missing_skills",), ["Go", "Kafka"]),
+        (("count",), 12),
+    ]
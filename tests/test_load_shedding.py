@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from app.services.load_shedding import (
+    ConcurrencyLimit,
+    Overloaded,
+    classify,
+    COST_CLASSES
+)
+
+
+def scope(method, path, query=b""):
+
+    return {"type": "http", "method": method, "path": path, "query_string": query}
+
+
+def test_classify():
+
+    assert classify(scope("POST", "/resume/optimize")) == "llm"
+    assert classify(scope("POST", "/resume/optimize", b"mode=fast")) == "local"
+    assert classify(scope("POST", "/resume/optimize/batch")) == "llm_batch"
+    assert classify(scope("GET", "/health")) is None
+
+    # Classified in the handler, by whether an optimization_id is given
+    assert classify(scope("POST", "/resume/download")) is None
+
+
+def test_batch_class_is_sized_by_jobs_per_batch():
+
+    assert COST_CLASSES["llm_batch"]["concurrency"] >= 1
+    assert COST_CLASSES["llm_batch"]["concurrency"] <= COST_CLASSES["llm"]["concurrency"]
+
+
+def test_queued_request_gets_the_released_slot():
+
+    async def scenario():
+
+        limit = ConcurrencyLimit("test", concurrency=1, queue=1, retry_after=1)
+
+        await limit.acquire()
+
+        waiter = asyncio.ensure_future(limit.acquire(timeout=1))
+        await asyncio.sleep(0)
+
+        # Queue is full and no slot is free
+        with pytest.raises(Overloaded):
+            await limit.acquire(timeout=1)
+
+        limit.release()
+        await waiter
+
+        assert limit.active == 1
+
+        limit.release()
+
+        assert limit.active == 0
+
+    asyncio.run(scenario())
+
+
+def test_try_acquire_never_queues():
+
+    limit = ConcurrencyLimit("test", concurrency=1, queue=4, retry_after=1)
+
+    assert limit.try_acquire()
+    assert not limit.try_acquire()
+
+    limit.release()
+
+    assert limit.active == 0
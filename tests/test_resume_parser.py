@@ -0,0 +1,144 @@
+import io
+
+import pdfplumber
+import pytest
+
+from app.services import warmup
+from app.services.resume_builder import build_resume_pdf
+from app.services.resume_parser import (
+    parse_resume,
+    parse_entry_header,
+    group_entries,
+    fallback_extract_contact,
+    fallback_extract_name,
+    NAME_PLACEHOLDER
+)
+
+
+def pdf_text(content: bytes) -> str:
+
+    with pdfplumber.open(io.BytesIO(content)) as pdf:
+        return "\n".join(page.extract_text() or "" for page in pdf.pages)
+
+
+# =====================================================
+# SAMPLE RESUME (bundled PDF and our own rendering)
+# =====================================================
+
+def check_sample(parsed):
+
+    experience = parsed["experience"]
+
+    assert [len(entry["bullets"]) for entry in experience] == [3, 2]
+
+    assert experience[0]["title"] == "Software Engineer Intern"
+    assert experience[0]["company"] == "Acme Technologies"
+    assert experience[0]["location"] == "Bangalore, India"
+
+    assert experience[1]["title"] == "Research Assistant"
+    assert experience[1]["company"] == "Data Systems Lab"
+
+    assert parsed["name"] == "Priya Sharma"
+    assert "+91 98765 43210" in parsed["contact"]
+
+
+def test_sample_pdf():
+
+    check_sample(parse_resume(pdf_text(warmup.sample_pdf())))
+
+
+def test_rendered_pdf_parses_back():
+
+    parsed = parse_resume(pdf_text(warmup.sample_pdf()))
+
+    buffer = build_resume_pdf(parsed)
+
+    try:
+        rendered = buffer.read()
+    finally:
+        buffer.close()
+
+    check_sample(parse_resume(pdf_text(rendered)))
+
+
+# =====================================================
+# ENTRY HEADERS
+# =====================================================
+
+@pytest.mark.parametrize("header, expected", [
+    (
+        ["Software Engineer Intern, Google   Jun 2023 – Aug 2023"],
+        ("Software Engineer Intern", "Google", "Jun 2023 – Aug 2023", ""),
+    ),
+    (
+        ["Google — Software Engineer Intern   Jun 2023 – Aug 2023"],
+        ("Software Engineer Intern", "Google", "Jun 2023 – Aug 2023", ""),
+    ),
+    (
+        ["Software Engineer at Microsoft (Jan 2022 – Present)"],
+        ("Software Engineer", "Microsoft", "Jan 2022 – Present", ""),
+    ),
+    (
+        ["Software Engineer, Amazon Web Services / Seattle, WA 2022 - Present"],
+        ("Software Engineer", "Amazon Web Services", "2022 - Present", "Seattle, WA"),
+    ),
+    (
+        ["Data Analyst | Flipkart | Bangalore, India | 2022 - 2023"],
+        ("Data Analyst", "Flipkart", "2022 - 2023", "Bangalore, India"),
+    ),
+    (
+        ["Backend Intern  Jan 2023 - Mar 2023", "Stripe", "Seattle, WA"],
+        ("Backend Intern", "Stripe", "Jan 2023 - Mar 2023", "Seattle, WA"),
+    ),
+])
+def test_parse_entry_header(header, expected):
+
+    parsed = parse_entry_header(header)
+
+    assert (
+        parsed["title"], parsed["company"], parsed["duration"], parsed["location"]
+    ) == expected
+
+
+def test_markerless_section_splits_on_dated_headers():
+
+    entries = group_entries([
+        "Backend Intern, Stripe  Jan 2023 - Mar 2023",
+        "Built a webhook retry queue handling two million events a day",
+        "Cut p99 latency of the billing API by forty percent",
+        "Teaching Assistant, IIT Delhi  Aug 2022 - Dec 2022",
+        "Ran weekly lab sessions for ninety students in data structures",
+    ])
+
+    assert [len(entry["bullets"]) for entry in entries] == [2, 1]
+
+
+def test_wrapped_bullets_are_joined():
+
+    entries = group_entries([
+        "Backend Intern, Stripe  Jan 2023 - Mar 2023",
+        "• Built a webhook retry queue that handled two million events",
+        "a day across regions",
+        "• Cut p99 latency by forty percent",
+    ])
+
+    assert entries[0]["bullets"] == [
+        "Built a webhook retry queue that handled two million events a day across regions",
+        "Cut p99 latency by forty percent",
+    ]
+
+
+# =====================================================
+# NAME / CONTACT
+# =====================================================
+
+def test_short_name_is_not_a_section_heading():
+
+    assert fallback_extract_name("Li\nExperience\nIntern") == "Li"
+    assert fallback_extract_name("Experience\n• Built things") == NAME_PLACEHOLDER
+
+
+def test_year_range_is_not_a_phone():
+
+    assert fallback_extract_contact("li@example.com\nIntern 2019 - 2023") == "li@example.com"
+    assert fallback_extract_contact("Phone: (555) 123-4567") == "(555) 123-4567"
@@ -0,0 +1,33 @@
+from app.services.skills import extract_skills, fast_keyword_match, covered_keywords
+
+
+def test_aliases_map_to_vocabulary_terms():
+
+    assert extract_skills("Golang, Node.js, sklearn and Postgres") == [
+        "go", "node", "scikit", "postgresql"
+    ]
+
+
+def test_plain_english_words_are_not_skills():
+
+    assert extract_skills("Ready to go and rest") == []
+
+
+def test_keywords_are_display_labels():
+
+    keywords = fast_keyword_match(
+        "Go, Node.js, scikit-learn",
+        "Go, Node.js, scikit-learn and PostgreSQL"
+    )
+
+    assert keywords["ats_keywords"] == ["Go", "Node.js", "scikit-learn"]
+    assert keywords["missing_skills"] == ["PostgreSQL"]
+
+
+def test_covered_keywords_adds_job_terms_outside_the_vocabulary():
+
+    assert covered_keywords(
+        ["Go"],
+        ["Kafka", "go", "Spark", "GraphQL"],
+        "Go services on Kafka and GraphQL"
+    ) == ["Go", "Kafka", "GraphQL"]
@@ -0,0 +1,35 @@
+import io
+import zipfile
+
+from app.services.zip_stream import ZipStream
+
+
+def test_entries_round_trip():
+
+    payload = bytes(range(256)) * 1000
+
+    archive = ZipStream()
+
+    chunks = list(archive.add("resume.pdf", io.BytesIO(payload), chunk_size=4096))
+    chunks.append(archive.add_bytes("errors.txt", b"none"))
+    chunks.append(archive.close())
+
+    # Bytes are handed back while the entry is written, not only at close
+    assert len(chunks) > 3
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as result:
+
+        assert result.namelist() == ["resume.pdf", "errors.txt"]
+        assert result.read("resume.pdf") == payload
+        assert result.read("errors.txt") == b"none"
+
+
+def test_deflated_archive():
+
+    archive = ZipStream(compression=zipfile.ZIP_DEFLATED)
+
+    data = b"".join(archive.add("a.txt", io.BytesIO(b"a" * 100000)))
+    data += archive.close()
+
+    with zipfile.ZipFile(io.BytesIO(data)) as result:
+        assert result.read("a.txt") == b"a" * 100000